@@ -1,20 +1,166 @@
 """Command to create databases from settings if they do not exist."""
 
-from typing import Any
+import importlib
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import ModuleType
+from typing import Any, TextIO
 
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
+# Connections and cursors of the database drivers (psycopg2, MySQLdb and
+# pyodbc), which are only imported when needed.
+DBAPIConnection = Any
+DBAPICursor = Any
+
+# Database names that can safely be used as a bracketed SQL Server
+# identifier.
+_MSSQL_DATABASE_NAME_RE = re.compile(r"[A-Za-z0-9_-]+")
+# Database names that can safely be used as a backquoted MySQL identifier.
+_MYSQL_DATABASE_NAME_RE = re.compile(r"[A-Za-z0-9_$-]+")
+
+# Engine name fragments and the vendor each one identifies.
+_ENGINE_RE = re.compile(r"sqlite3|postgresql|mysql|microsoft|mssql")
+_ENGINE_VENDORS = {
+    "sqlite3": "sqlite",
+    "postgresql": "postgresql",
+    "mysql": "mysql",
+    "microsoft": "mssql",
+    "mssql": "mssql",
+}
+
+# Driver module used to create the databases of each vendor.
+_VENDOR_DRIVERS = {
+    "postgresql": "psycopg2",
+    "mysql": "MySQLdb",
+    "mssql": "pyodbc",
+}
+
+# Command methods that connect to a server and create a database on it.
+_VENDOR_HANDLERS = {
+    "postgresql": ("connect_postgresql", "create_postgresql_db"),
+    "mysql": ("connect_mysql", "create_mysql_db"),
+    "mssql": ("connect_mssql", "create_mssql_db"),
+}
+
+# Database driver modules, imported on first use.
+_drivers: dict[str, ModuleType] = {}
+
+
+def get_driver(name: str) -> ModuleType:
+    """
+    Get a database driver module, importing it on first use.
+
+    Args:
+        name (str): The name of the driver module, e.g. psycopg2.
+
+    Returns:
+        ModuleType: The driver module.
+    """
+    try:
+        return _drivers[name]
+    except KeyError:
+        return _drivers.setdefault(name, importlib.import_module(name))
+
+
+def get_engine_vendor(engine: str) -> str | None:
+    """
+    Get the vendor for a database engine.
+
+    Args:
+        engine (str): The ENGINE of the database settings.
+
+    Returns:
+        str | None: The vendor of the engine, or None if it is not
+            supported.
+    """
+    match = _ENGINE_RE.search(engine)
+    return _ENGINE_VENDORS[match.group()] if match else None
+
+
+def validate_mysql_database_name(db_name: str) -> None:
+    """
+    Validate a MySQL database name before it is used in a statement.
+
+    Args:
+        db_name (str): The name of the database.
+
+    Raises:
+        ValueError: If the database name contains invalid characters.
+    """
+    # The name cannot be bound as a parameter in CREATE DATABASE
+    if not _MYSQL_DATABASE_NAME_RE.fullmatch(db_name):
+        raise ValueError(
+            f"Invalid database name: {db_name}. Only alphanumeric characters, underscores, dollar signs, and hyphens are allowed."  # noqa: E501
+        )
+
 
 class Command(BaseCommand):
     """Django management command to create databases specified in settings."""
 
     help = "Create databases specified in Django settings if they do not exist"
 
+    def __init__(
+        self,
+        stdout: TextIO | None = None,
+        stderr: TextIO | None = None,
+        no_color: bool = False,
+        force_color: bool = False,
+    ) -> None:
+        """
+        Initialize the command.
+
+        Args:
+            stdout (Optional[TextIO]): Stream to use as stdout. Defaults: None.
+            stderr (Optional[TextIO]): Stream to use as stderr. Defaults: None.
+            no_color (bool): If True, disable colored output. Defaults: False.
+            force_color (bool): If True, force colored output. Defaults: False.
+
+        Returns:
+            None
+        """
+        super().__init__(stdout, stderr, no_color, force_color)
+        self._output_buffer: list[str] = []
+
+    def write_output(self, message: str) -> None:
+        """
+        Buffer a message for stdout.
+
+        Messages are collected and written in one go by flush_output.
+        Appending to the buffer is atomic, so it is also safe from the
+        per-server worker threads. Errors are still written to stderr
+        straight away.
+
+        Args:
+            message (str): The message to write.
+
+        Returns:
+            None
+        """
+        self._output_buffer.append(f"{message}\n")
+
+    def flush_output(self) -> None:
+        """
+        Write the buffered messages to stdout.
+
+        Returns:
+            None
+        """
+        if self._output_buffer:
+            self.stdout.write("".join(self._output_buffer), ending="")
+            self._output_buffer.clear()
+
     def handle(self, *args: str, **options: dict[str, str]) -> None:
         """
         Execute the command to create databases.
 
+        Databases on the same server are created through a single
+        connection to that server. Servers are independent of each other,
+        so when there is more than one they are processed concurrently,
+        each in its own thread. Output is written once all servers have
+        been processed.
+
         Args:
             *args: Variable length argument list.
             **options: Arbitrary keyword arguments.
@@ -22,44 +168,119 @@ class Command(BaseCommand):
         Returns:
             None
         """
+        sqlite_databases = []
+        databases_by_server = {}
         for db_name, db_settings in settings.DATABASES.items():
-            self.stdout.write(f"Checking database '{db_name}'...")
+            # SQLite databases need no server, so they are not checked
+            engine = db_settings.get("ENGINE", "")
+            if get_engine_vendor(engine) == "sqlite":
+                sqlite_databases.append(db_name)
+                continue
+
+            self.write_output(f"Checking database '{db_name}'...")
 
             try:
-                self.create_database_if_not_exists(db_name, db_settings)
-            except Exception as e:
-                self.stderr.write(
-                    self.style.ERROR(
-                        f"Error creating database '{db_name}': {str(e)}"
-                    )
+                server = self.get_server(db_name, db_settings)
+            except ValueError as e:
+                self.write_error(db_name, e)
+                continue
+            databases_by_server.setdefault(server, []).append(
+                (db_name, db_settings)
+            )
+
+        if sqlite_databases:
+            names = ", ".join(f"'{name}'" for name in sqlite_databases)
+            label = "database" if len(sqlite_databases) == 1 else "databases"
+            self.write_output(
+                self.style.SUCCESS(
+                    f"SQLite {label} {names} will be created automatically when needed."  # noqa: E501
                 )
+            )
 
-    def create_database_if_not_exists(
-        self, db_name: str, db_settings: dict[str, Any]
+        try:
+            self.process_servers(databases_by_server)
+        finally:
+            self.flush_output()
+
+    def process_servers(
+        self, databases_by_server: dict[tuple, list[tuple[str, dict]]]
     ) -> None:
         """
-        Create a database if it doesn't exist based on the database engine.
+        Create the databases of each server.
+
+        Args:
+            databases_by_server (dict[tuple, list[tuple[str, dict]]]): The
+                names and settings of the databases, grouped by server.
+
+        Returns:
+            None
+        """
+        if len(databases_by_server) <= 1:
+            for databases in databases_by_server.values():
+                self.create_server_databases(databases)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(16, len(databases_by_server))
+        ) as executor:
+            futures = [
+                executor.submit(self.create_server_databases, databases)
+                for databases in databases_by_server.values()
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+    def write_error(self, db_name: str, error: Exception) -> None:
+        """
+        Write an error for a database to stderr.
+
+        Args:
+            db_name (str): The name of the database.
+            error (Exception): The error raised for the database.
+
+        Returns:
+            None
+        """
+        self.stderr.write(
+            self.style.ERROR(
+                f"Error creating database '{db_name}': {str(error)}"
+            )
+        )
+
+    def write_errors(
+        self, databases: list[tuple[str, dict[str, Any]]], error: Exception
+    ) -> None:
+        """
+        Write an error for each of the given databases to stderr.
+
+        Args:
+            databases (list[tuple[str, dict[str, Any]]]): The names and
+                settings of the databases.
+            error (Exception): The error raised for the databases.
+
+        Returns:
+            None
+        """
+        for db_name, _ in databases:
+            self.write_error(db_name, error)
+
+    def get_server(self, db_name: str, db_settings: dict[str, Any]) -> tuple:
+        """
+        Get the server a database is created on.
 
         Args:
             db_name (str): The name of the database.
             db_settings (Dict[str, Any]): The database settings dictionary.
 
         Raises:
-            ValueError: If the database engine is not supported or if the
-            database name is not specified.
+            ValueError: If the database engine is not supported, if the
+            database name is not specified or if the port is invalid.
 
         Returns:
-            None
+            tuple: The engine, host, port and user of the server.
         """
         engine = db_settings.get("ENGINE", "")
-
-        if "sqlite3" in engine:
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"SQLite database '{db_name}' will be created automatically when needed."  # noqa: E501
-                )
-            )
-            return
+        vendor = get_engine_vendor(engine)
 
         db_name = db_settings.get("NAME")
         if not db_name:
@@ -67,29 +288,124 @@ class Command(BaseCommand):
                 f"Database name for '{db_name}' is not specified in settings."
             )
 
-        if "postgresql" in engine:
-            self.create_postgresql_db(db_settings)
-        elif "mysql" in engine:
-            self.create_mysql_db(db_settings)
-        elif "microsoft" in engine or "mssql" in engine:
-            self.create_mssql_db(db_settings)
-        else:
+        if vendor is None:
             raise ValueError(f"Unsupported database engine: {engine}")
 
-    def create_postgresql_db(self, db_settings: dict[str, Any]) -> None:
+        # MySQLdb needs the port as a number
+        port = db_settings.get("PORT", "")
+        if vendor == "mysql" and port:
+            try:
+                int(port)
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid port: {port!r}") from None
+
+        return (
+            engine,
+            db_settings.get("HOST", ""),
+            port,
+            db_settings.get("USER", ""),
+        )
+
+    def create_server_databases(
+        self, databases: list[tuple[str, dict[str, Any]]]
+    ) -> None:
         """
-        Create a PostgreSQL database if it doesn't exist.
+        Create the databases of a single server if they don't exist.
+
+        One connection to the server is opened, using the settings of the
+        first database, and shared by all of the databases. Missing drivers
+        and database errors are reported per database, any other error is
+        raised.
 
         Args:
+            databases (list[tuple[str, dict[str, Any]]]): The names and
+                settings of the databases on the server.
+
+        Returns:
+            None
+        """
+        _, server_settings = databases[0]
+        vendor = get_engine_vendor(server_settings.get("ENGINE", ""))
+        # The databases of a MySQL server are created in a single batch
+        batch = vendor == "mysql" and len(databases) > 1
+        options = {"multi_statements": True} if batch else {}
+        try:
+            driver = get_driver(_VENDOR_DRIVERS[vendor])
+            conn = self.connect(server_settings, **options)
+        except ImportError as e:
+            self.write_errors(databases, e)
+            return
+        except driver.Error as e:
+            self.write_errors(databases, e)
+            return
+
+        # Invalid names are reported the same way as database errors
+        db_errors = (driver.Error, ValueError)
+
+        try:
+            cur = conn.cursor()
+            if batch:
+                self.create_mysql_dbs(cur, databases)
+            else:
+                for db_name, db_settings in databases:
+                    try:
+                        self.create_database_if_not_exists(cur, db_settings)
+                    except db_errors as e:
+                        self.write_error(db_name, e)
+            cur.close()
+        finally:
+            conn.close()
+
+    def connect(
+        self, db_settings: dict[str, Any], **options: bool
+    ) -> DBAPIConnection:
+        """
+        Connect to the server of a database.
+
+        Args:
+            db_settings (Dict[str, Any]): The database settings dictionary.
+            **options: Options for the vendor's connect method, e.g.
+                multi_statements for MySQL.
+
+        Returns:
+            DBAPIConnection: The DB-API connection to the server.
+        """
+        vendor = get_engine_vendor(db_settings.get("ENGINE", ""))
+        connect, _ = _VENDOR_HANDLERS[vendor]
+        return getattr(self, connect)(db_settings, **options)
+
+    def create_database_if_not_exists(
+        self, cur: DBAPICursor, db_settings: dict[str, Any]
+    ) -> None:
+        """
+        Create a database if it doesn't exist based on the database engine.
+
+        Args:
+            cur (DBAPICursor): A DB-API cursor on the database's server.
             db_settings (Dict[str, Any]): The database settings dictionary.
 
         Returns:
             None
         """
-        import psycopg2
-        from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+        vendor = get_engine_vendor(db_settings.get("ENGINE", ""))
+        _, create_db = _VENDOR_HANDLERS[vendor]
+        getattr(self, create_db)(cur, db_settings["NAME"])
+
+    def connect_postgresql(
+        self, db_settings: dict[str, Any]
+    ) -> DBAPIConnection:
+        """
+        Connect to the administrative database of a PostgreSQL server.
+
+        Args:
+            db_settings (Dict[str, Any]): The database settings dictionary.
+
+        Returns:
+            DBAPIConnection: The psycopg2 connection, in autocommit mode.
+        """
+        psycopg2 = get_driver("psycopg2")
+        extensions = get_driver("psycopg2.extensions")
 
-        db_name = db_settings["NAME"]
         user = db_settings.get("USER", "")
         password = db_settings.get("PASSWORD", "")
         host = db_settings.get("HOST", "")
@@ -102,71 +418,175 @@ class Command(BaseCommand):
             host=host,
             port=port,
         )
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
-        cur = conn.cursor()
+        conn.set_isolation_level(extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        return conn
+
+    def create_postgresql_db(self, cur: DBAPICursor, db_name: str) -> None:
+        """
+        Create a PostgreSQL database if it doesn't exist.
+
+        Args:
+            cur (DBAPICursor): A psycopg2 cursor on the server.
+            db_name (str): The name of the database.
+
+        Returns:
+            None
+        """
+        sql = get_driver("psycopg2.sql")
+
         cur.execute(
             "SELECT 1 FROM pg_catalog.pg_database WHERE datname = %s",
             (db_name,),
         )
         exists = cur.fetchone()
         if not exists:
-            cur.execute(f"CREATE DATABASE {db_name}")
-            self.stdout.write(
+            # Quote the name, so that it is used exactly as it is matched
+            # against datname above rather than folded to lower case.
+            cur.execute(
+                sql.SQL("CREATE DATABASE {}").format(sql.Identifier(db_name))
+            )
+            self.write_output(
                 self.style.SUCCESS(f"Created PostgreSQL database '{db_name}'")
             )
         else:
-            self.stdout.write(
+            self.write_output(
                 self.style.SUCCESS(
                     f"PostgreSQL database '{db_name}' already exists"
                 )
             )
-        cur.close()
-        conn.close()
 
-    def create_mysql_db(self, db_settings: dict[str, Any]) -> None:
+    def connect_mysql(
+        self, db_settings: dict[str, Any], multi_statements: bool = False
+    ) -> DBAPIConnection:
         """
-        Create a MySQL database if it doesn't exist.
+        Connect to a MySQL server.
 
         Args:
             db_settings (Dict[str, Any]): The database settings dictionary.
+            multi_statements (bool): If True, allow several statements to be
+                run in one execute. Defaults: False.
 
         Returns:
-            None
+            DBAPIConnection: The MySQLdb connection.
         """
-        import MySQLdb
+        mysqldb = get_driver("MySQLdb")
 
-        db_name = db_settings["NAME"]
         user = db_settings.get("USER", "")
         password = db_settings.get("PASSWORD", "")
         host = db_settings.get("HOST", "")
-        port = int(db_settings.get("PORT", 3306))
+        port = int(db_settings.get("PORT") or 3306)
+
+        options = {}
+        if multi_statements:
+            client = get_driver("MySQLdb.constants.CLIENT")
+            options["client_flag"] = client.MULTI_STATEMENTS
 
-        conn = MySQLdb.connect(
-            user=user, passwd=password, host=host, port=port
+        return mysqldb.connect(
+            user=user,
+            passwd=password,
+            host=host,
+            port=port,
+            **options,
         )
-        cur = conn.cursor()
+
+    def create_mysql_db(self, cur: DBAPICursor, db_name: str) -> None:
+        """
+        Create a MySQL database if it doesn't exist.
+
+        Args:
+            cur (DBAPICursor): A MySQLdb cursor on the server.
+            db_name (str): The name of the database.
+
+        Raises:
+            ValueError: If the database name contains invalid characters.
+
+        Returns:
+            None
+        """
+        validate_mysql_database_name(db_name)
         cur.execute(f"CREATE DATABASE IF NOT EXISTS `{db_name}`")
-        self.stdout.write(
+        self.write_output(
             self.style.SUCCESS(
                 f"Created (if not exists) MySQL database '{db_name}'"
             )
         )
-        cur.close()
-        conn.close()
 
-    def create_mssql_db(self, db_settings: dict[str, Any]) -> None:
+    def create_mysql_dbs(
+        self, cur: DBAPICursor, databases: list[tuple[str, dict[str, Any]]]
+    ) -> None:
         """
-        Create a Microsoft SQL Server database if it doesn't exist.
+        Create several MySQL databases on one server in a single statement.
+
+        Databases with invalid names are reported and skipped. MySQL stops
+        running a batch at the first statement that fails, so the error is
+        reported for that database only and the databases after it are
+        retried in a new batch.
 
         Args:
-            db_settings (Dict[str, Any]): The database settings dictionary.
+            cur (DBAPICursor): A MySQLdb cursor on the server, connected with
+                multiple statements enabled.
+            databases (list[tuple[str, dict[str, Any]]]): The names and
+                settings of the databases on the server.
 
         Returns:
             None
         """
-        import pyodbc
+        valid_databases = []
+        for db_name, db_settings in databases:
+            try:
+                validate_mysql_database_name(db_settings["NAME"])
+            except ValueError as e:
+                self.write_error(db_name, e)
+            else:
+                valid_databases.append((db_name, db_settings))
+
+        mysql_error = get_driver("MySQLdb").Error
+        while valid_databases:
+            names = [db_settings["NAME"] for _, db_settings in valid_databases]
+            # Count the statements that succeeded. The first one runs in
+            # execute and each further one in a call to nextset, which
+            # raises the error of the statement that failed.
+            created = 0
+            error = None
+            try:
+                cur.execute(
+                    "; ".join(
+                        f"CREATE DATABASE IF NOT EXISTS `{name}`"
+                        for name in names
+                    )
+                )
+                created += 1
+                while cur.nextset():
+                    created += 1
+            except mysql_error as e:
+                error = e
+            else:
+                created = len(names)
+
+            for name in names[:created]:
+                self.write_output(
+                    self.style.SUCCESS(
+                        f"Created (if not exists) MySQL database '{name}'"
+                    )
+                )
+            if error is None:
+                return
+
+            self.write_errors(valid_databases[created : created + 1], error)
+            valid_databases = valid_databases[created + 1 :]
+
+    def connect_mssql(self, db_settings: dict[str, Any]) -> DBAPIConnection:
+        """
+        Connect to the master database of a Microsoft SQL Server.
+
+        Args:
+            db_settings (Dict[str, Any]): The database settings dictionary.
+
+        Returns:
+            DBAPIConnection: The pyodbc connection, in autocommit mode.
+        """
+        pyodbc = get_driver("pyodbc")
 
-        db_name = db_settings["NAME"]
         user = db_settings.get("USER", "")
         password = db_settings.get("PASSWORD", "")
         host = db_settings.get("HOST", "")
@@ -179,25 +599,52 @@ class Command(BaseCommand):
         else:
             conn_str = f"DRIVER={{{driver}}};SERVER={host};DATABASE=master;UID={user};PWD={password}"  # noqa: E501
 
-        conn = pyodbc.connect(conn_str, autocommit=True)
-        cur = conn.cursor()
+        return pyodbc.connect(conn_str, autocommit=True)
+
+    def create_mssql_db(self, cur: DBAPICursor, db_name: str) -> None:
+        """
+        Create a Microsoft SQL Server database if it doesn't exist.
+
+        Args:
+            cur (DBAPICursor): A pyodbc cursor on the server.
+            db_name (str): The name of the database.
+
+        Raises:
+            ValueError: If the database name contains invalid characters.
 
+        Returns:
+            None
+        """
+        # The name cannot be bound as a parameter in CREATE DATABASE
+        if not _MSSQL_DATABASE_NAME_RE.fullmatch(db_name):
+            raise ValueError(
+                f"Invalid database name: {db_name}. Only alphanumeric characters, underscores, and hyphens are allowed."  # noqa: E501
+            )
+
+        # Check and create in a single round-trip, reporting back whether
+        # the database was created.
         cur.execute(
-            f"SELECT name FROM sys.databases WHERE name = N'{db_name}'"
+            f"""
+            SET NOCOUNT ON;
+            IF NOT EXISTS (SELECT 1 FROM sys.databases WHERE name = ?)
+            BEGIN
+                CREATE DATABASE [{db_name}];
+                SELECT 1;
+            END
+            ELSE
+                SELECT 0;
+            """,
+            (db_name,),
         )
-        exists = cur.fetchone()
+        created = cur.fetchone()[0]
 
-        if not exists:
-            cur.execute(f"CREATE DATABASE [{db_name}]")
-            self.stdout.write(
+        if created:
+            self.write_output(
                 self.style.SUCCESS(f"Created SQL Server database '{db_name}'")
             )
         else:
-            self.stdout.write(
+            self.write_output(
                 self.style.SUCCESS(
                     f"SQL Server database '{db_name}' already exists"
                 )
             )
-
-        cur.close()
-        conn.close()
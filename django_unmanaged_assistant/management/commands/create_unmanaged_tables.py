@@ -1,35 +1,155 @@
 """Management command to create tables for unmanaged models in the project."""
 
+import os
 import re
-from contextlib import ExitStack, contextmanager
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import TextIO
 
 from django.apps import AppConfig, apps
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandParser
-from django.db import connections, models
+from django.db import connections, models, router
 from django.db.backends.base.base import BaseDatabaseWrapper
 from django.db.backends.base.schema import BaseDatabaseSchemaEditor
 from django.db.models import Field, Model
 from django.db.utils import ProgrammingError
 
+_MSSQL_VENDORS = frozenset({"microsoft", "mssql"})
+# Vendors whose tables and columns are looked up in INFORMATION_SCHEMA.
+_INFORMATION_SCHEMA_VENDORS = frozenset({"postgresql", "microsoft"})
+_DEFAULT_SCHEMAS = {
+    "postgresql": "public",
+    "microsoft": "dbo",
+    "sqlite": "main",
+}
+_TABLE_NAME_FORMATS = {
+    "postgresql": '"{schema}"."{table}"',
+    "microsoft": "[{schema}].[{table}]",
+    "mssql": "[{schema}].[{table}]",
+}
+
+_SCHEMA_NAME_RE = re.compile(r"^[A-Za-z0-9_.]+$")
+# Quote characters stripped from table names before they are split.
+_IDENTIFIER_QUOTES = str.maketrans("", "", "[]\"'")
+
+_COMPATIBLE_TYPES = {
+    "int": frozenset(
+        {
+            "int",
+            "integer",
+            "smallint",
+            "bigint",
+            "tinyint",
+            "int2",
+            "int4",
+            "int8",
+            "serial",
+            "smallserial",
+            "bigserial",
+            "integer unsigned",
+            "smallint unsigned",
+            "bigint unsigned",
+        }
+    ),
+    "varchar": frozenset(
+        {
+            "varchar",
+            "char",
+            "text",
+            "nvarchar",
+            "nchar",
+            "ntext",
+            "character",
+            "character varying",
+        }
+    ),
+    "float": frozenset(
+        {"float", "real", "double precision", "float4", "float8"}
+    ),
+    "decimal": frozenset({"decimal", "numeric"}),
+    "datetime": frozenset(
+        {
+            "datetime",
+            "datetime2",
+            "datetimeoffset",
+            "smalldatetime",
+            "timestamp",
+            "timestamptz",
+            "timestamp with time zone",
+            "timestamp without time zone",
+            "date",
+            "time",
+            "time with time zone",
+            "time without time zone",
+        }
+    ),
+    "bool": frozenset({"bool", "boolean", "bit"}),
+}
+# Reverse lookup of database type to its compatibility group.
+_TYPE_GROUP = {
+    db_type: group
+    for group, compatible_list in _COMPATIBLE_TYPES.items()
+    for db_type in compatible_list
+}
+
+
+def get_installed_package_paths() -> tuple[str, ...]:
+    """
+    Get the directories that third-party packages are installed into.
+
+    Returns:
+        tuple[str, ...]: The site-packages and dist-packages directories on
+            sys.path, each ending with a path separator.
+    """
+    return tuple(
+        os.path.join(path, "")
+        for path in sys.path
+        if path.endswith(("site-packages", "dist-packages"))
+    )
+
 
-def is_app_eligible(app_config: AppConfig) -> bool:
+def is_app_eligible(
+    app_config: AppConfig,
+    exclude_path: str | tuple[str, ...] | None = None,
+    additional_apps: frozenset[str] | None = None,
+) -> bool:
     """
     Check if the app is eligible for processing.
 
+    A string exclude path excludes apps whose path contains it, while a
+    tuple excludes apps whose path starts with any of its entries.
+
     Args:
         app_config (AppConfig): The Django app configuration.
+        exclude_path (str | tuple[str, ...] | None): Path fragment or path
+            prefixes of apps to exclude. Defaults to the
+            EXCLUDE_UNMANAGED_PATH setting, or to the installed package
+            directories if it is not set.
+        additional_apps (frozenset[str] | None): App names to include even
+            when excluded by path. Defaults to the
+            ADDITIONAL_UNMANAGED_TABLE_APPS setting.
 
     Returns:
         bool: True if the app is eligible for processing, False otherwise.
     """
-    app_name = app_config.name.split(".")[-1]
-    exclude_path = getattr(settings, "EXCLUDE_UNMANAGED_PATH", "site-packages")
-    is_local_app = exclude_path not in app_config.path
-    is_additional_app = app_name in getattr(
-        settings, "ADDITIONAL_UNMANAGED_TABLE_APPS", []
-    )
+    if exclude_path is None:
+        exclude_path = (
+            getattr(settings, "EXCLUDE_UNMANAGED_PATH", None)
+            or get_installed_package_paths()
+        )
+    if additional_apps is None:
+        additional_apps = frozenset(
+            getattr(settings, "ADDITIONAL_UNMANAGED_TABLE_APPS", [])
+        )
+    app_name = app_config.name.rpartition(".")[2]
+    if isinstance(exclude_path, str):
+        is_local_app = exclude_path not in app_config.path
+    else:
+        is_local_app = not app_config.path.startswith(exclude_path)
+    is_additional_app = app_name in additional_apps
     return is_local_app or is_additional_app
 
 
@@ -45,14 +165,7 @@ def get_default_schema(
     Returns:
         str: The default schema name.
     """
-    if connection.vendor == "postgresql":
-        return "public"
-    elif connection.vendor == "microsoft":
-        return "dbo"
-    elif connection.vendor == "sqlite":
-        return "main"
-    else:
-        return None
+    return _DEFAULT_SCHEMAS.get(connection.vendor)
 
 
 def create_schema_if_not_exists(
@@ -69,159 +182,258 @@ def create_schema_if_not_exists(
         ValueError: If the schema name contains invalid characters.
         ProgrammingError: If there's an error executing the SQL.
     """
-    # Validate the schema name
-    if not re.match(r"^[A-Za-z0-9_.]+$", schema):
-        raise ValueError(
-            f"Invalid schema name: {schema}. Only alphanumeric characters, underscores, and periods are allowed."  # noqa: E501
-        )
+    create_schemas_if_not_exist(connection, [schema])
 
-    with connection.cursor() as cursor:
-        # TODO: Handle schema selection and creation for database backends
-        if connection.vendor == "sqlite":
-            # SQLite does not support schemas in the same way as other
-            # databases, it would require a separate database.
-            return
-        if connection.vendor == "postgresql":
-            from psycopg2 import sql
 
-            cursor.execute(
-                sql.SQL("CREATE SCHEMA IF NOT EXISTS {}").format(
-                    sql.Identifier(schema)
-                )
-            )
-        elif connection.vendor in ["microsoft", "mssql"]:
-            # TODO: Verify Microsoft SQL Server schema creation
-            cursor.execute(
-                "SELECT 1 FROM sys.schemas WHERE name = %s", [schema]
-            )
-            if cursor.fetchone() is None:
-                cursor.execute(f"CREATE SCHEMA [{schema}]")
-        else:
-            raise NotImplementedError(
-                f"Schema creation not implemented for {connection.vendor}"
+def create_schemas_if_not_exist(
+    connection: BaseDatabaseWrapper, schemas: list[str]
+) -> None:
+    """
+    Create the schemas that don't exist, in a single round-trip.
+
+    Args:
+        connection (BaseDatabaseWrapper): The database connection.
+        schemas (list[str]): The names of the schemas to create.
+
+    Raises:
+        ValueError: If a schema name contains invalid characters.
+        ProgrammingError: If there's an error executing the SQL.
+    """
+    # Validate the schema names
+    for schema in schemas:
+        if not _SCHEMA_NAME_RE.match(schema):
+            raise ValueError(
+                f"Invalid schema name: {schema}. Only alphanumeric characters, underscores, and periods are allowed."  # noqa: E501
             )
 
+    # TODO: Handle schema selection and creation for database backends
+    if connection.vendor == "sqlite":
+        # SQLite does not support schemas in the same way as other
+        # databases, it would require a separate database.
+        return
+    if not schemas:
+        return
+
+    quote_name = connection.ops.quote_name
+    if connection.vendor == "postgresql":
+        sql = "; ".join(
+            f"CREATE SCHEMA IF NOT EXISTS {quote_name(schema)}"
+            for schema in schemas
+        )
+        params = None
+    elif connection.vendor in _MSSQL_VENDORS:
+        # TODO: Verify Microsoft SQL Server schema creation
+        # CREATE SCHEMA must be the only statement in its batch, hence the
+        # EXEC.
+        sql = "\n".join(
+            "IF NOT EXISTS (SELECT 1 FROM sys.schemas WHERE name = %s) "
+            "EXEC(%s)"
+            for _ in schemas
+        )
+        params = []
+        for schema in schemas:
+            params += [schema, f"CREATE SCHEMA {quote_name(schema)}"]
+    else:
+        raise NotImplementedError(
+            f"Schema creation not implemented for {connection.vendor}"
+        )
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
 
-def table_exists(
+def get_existing_tables(
     connection: BaseDatabaseWrapper,
-    schema: str,
-    table: str,
-) -> bool:
+    schemas: set[str],
+) -> set[tuple[str, str]]:
     """
-    Check if a table exists in the specified schema.
+    Get the existing tables for the given schemas in a single query.
 
-    This method queries thd db to determine if a table with the given name
-    exists in the specified schema.
+    This method queries the db once for every table in the given schemas so
+    table existence can be checked in memory rather than with a round-trip
+    per model.
 
     Args:
         connection (BaseDatabaseWrapper): The database connection.
-        schema (str): The database schema name.
-        table (str): The database table name.
+        schemas (set[str]): The database schema names to look in.
 
     Returns:
-        bool: True if the table exists, False otherwise.
+        set[tuple[str, str]]: The (schema, table) pairs that exist.
+
+    Raises:
+        NotImplementedError: If the database vendor is not supported.
     """
     with connection.cursor() as cursor:
         if connection.vendor == "sqlite":
+            # SQLite has no schemas; every table lives in 'main'.
             cursor.execute(
                 """
-                SELECT 1
+                SELECT 'main', name
                 FROM sqlite_master
-                WHERE type = 'table' AND name = %s
-            """,
-                [table],
+                WHERE type = 'table'
+            """
             )
-        elif connection.vendor == "postgresql":
+        elif connection.vendor in _INFORMATION_SCHEMA_VENDORS:
+            if not schemas:
+                return set()
+            placeholders = ", ".join(["%s"] * len(schemas))
             cursor.execute(
-                """
-                SELECT 1
+                f"""
+                SELECT TABLE_SCHEMA, TABLE_NAME
                 FROM INFORMATION_SCHEMA.TABLES
-                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-            """,
-                [schema, table],
+                WHERE TABLE_SCHEMA IN ({placeholders})
+            """,  # noqa: S608
+                list(schemas),
             )
-        elif connection.vendor == "microsoft":
-            cursor.execute(
-                """
-                SELECT 1
-                FROM INFORMATION_SCHEMA.TABLES
-                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-            """,
-                [schema, table],
+        else:
+            raise NotImplementedError(
+                f"Table lookup not implemented for {connection.vendor}"
             )
-        return cursor.fetchone() is not None
+        return {(schema, table) for schema, table in cursor.fetchall()}
 
 
-def column_exists(
+def get_existing_columns(
     connection: BaseDatabaseWrapper,
-    schema: str,
-    table: str,
-    column_name: str,
-) -> bool:
+    tables: set[tuple[str, str]],
+) -> dict[tuple[str, str], dict[str, str]]:
     """
-    Check if a column exists in the specified table and schema.
+    Get the existing columns and their data types for the given tables.
 
-    This method queries the INFORMATION_SCHEMA.COLUMNS view to determine
-    if a column with the given name exists in the specified table and
-    schema.
+    This method fetches the columns of every given table in a single query
+    so column existence and type checks can be served from memory rather
+    than with one or two round-trips per field. The query only filters by
+    schema, which keeps the number of bound parameters small however many
+    tables there are (SQL Server allows at most 2100), and the given tables
+    are picked out of the result.
 
     Args:
         connection (BaseDatabaseWrapper): The database connection.
-        schema (str): The database schema name.
-        table (str): The database table name.
-        column_name (str): The name of the column to check for existence.
+        tables (set[tuple[str, str]]): The (schema, table) pairs to look up.
 
     Returns:
-        bool: True if the column exists, False otherwise.
+        dict[tuple[str, str], dict[str, str]]: A mapping of (schema, table)
+        to a mapping of column name to data type.
 
     Raises:
+        NotImplementedError: If the database vendor is not supported.
         django.db.Error: If there's an error executing the SQL query.
     """
+    if not tables:
+        return {}
+
     with connection.cursor() as cursor:
         if connection.vendor == "sqlite":
+            # SQLite has no schemas; every table lives in 'main'.
             cursor.execute(
                 """
-                SELECT 1
-                FROM pragma_table_info(%s)
-                WHERE name = %s
-            """,
-                [table, column_name],
-            )
-        elif connection.vendor == "postgresql":
-            cursor.execute(
-                """
-                SELECT 1
-                FROM information_schema.columns
-                WHERE table_schema = %s
-                  AND table_name = %s
-                  AND column_name = %s
-            """,
-                [schema, table, column_name],
+                SELECT 'main', m.name, p.name, p.type
+                FROM sqlite_master AS m
+                JOIN pragma_table_info(m.name) AS p
+                WHERE m.type = 'table'
+            """
             )
-        elif connection.vendor == "microsoft":
+        elif connection.vendor in _INFORMATION_SCHEMA_VENDORS:
+            schemas = sorted({schema for schema, _ in tables})
+            placeholders = ", ".join(["%s"] * len(schemas))
             cursor.execute(
-                """
-                SELECT 1
+                f"""
+                SELECT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME, DATA_TYPE
                 FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME = %s
-            """,
-                [schema, table, column_name],
+                WHERE TABLE_SCHEMA IN ({placeholders})
+            """,  # noqa: S608
+                schemas,
+            )
+        else:
+            raise NotImplementedError(
+                f"Column lookup not implemented for {connection.vendor}"
             )
-        return cursor.fetchone() is not None
+
+        existing_columns: dict[tuple[str, str], dict[str, str]] = {}
+        for schema, table, column_name, data_type in cursor.fetchall():
+            if (schema, table) in tables:
+                existing_columns.setdefault((schema, table), {})[
+                    column_name
+                ] = data_type
+        return existing_columns
+
+
+def get_column_name(field: Field, is_foreign_key: bool | None = None) -> str:
+    """
+    Get the name of the database column for a Django model field.
+
+    Args:
+        field (Field): The Django model field.
+        is_foreign_key (bool | None): Whether the field is a FK, if already
+            known. Checked against the field type when not given.
+
+    Returns:
+        str: The column name for the field.
+    """
+    # Use db_column exactly as specified when it is set
+    if field.db_column:
+        return field.db_column
+
+    column_name = field.name
+    if is_foreign_key is None:
+        is_foreign_key = isinstance(field, models.ForeignKey)
+    # For foreign keys, append '_id' only if it's not already there
+    if is_foreign_key and not column_name.endswith("_id"):
+        column_name += "_id"
+    return column_name
 
 
-def get_field_db_type(connection: BaseDatabaseWrapper, field: Field) -> str:
+def get_field_db_type(
+    connection: BaseDatabaseWrapper,
+    field: Field,
+    cache: dict[tuple, str | None],
+) -> str:
     """
     Get the database type for a Django model field.
 
+    Types of fields that rely on the default Field.db_type are cached by
+    field signature. The type depends on the connection's data_types, so
+    the cache must only be shared by fields of the same connection.
+    Relations and fields overriding db_type are resolved on every call.
+
     Args:
         connection (BaseDatabaseWrapper): The database connection.
         field (Field): The Django model field.
+        cache (dict[tuple, str | None]): The cached types of the
+            connection.
 
     Returns:
         str: The database type for the field.
     """
-    return field.db_type(connection)
+    field_class = type(field)
+    if field.is_relation or field_class.db_type is not Field.db_type:
+        return field.db_type(connection)
+
+    key = (
+        field_class,
+        getattr(field, "max_length", None),
+        getattr(field, "max_digits", None),
+        getattr(field, "decimal_places", None),
+    )
+    try:
+        return cache[key]
+    except KeyError:
+        return cache.setdefault(key, field.db_type(connection))
+
+
+def normalize_db_type(db_type: str | None) -> str:
+    """
+    Normalize a database column type for comparison.
+
+    Args:
+        db_type (str | None): The database column type, e.g. varchar(100).
+
+    Returns:
+        str: The lower case type without its length or precision, e.g.
+            varchar. An empty string if no type is given.
+    """
+    if not db_type:
+        return ""
+    return db_type.partition("(")[0].strip().lower()
 
 
 def types_are_compatible(existing_type: str, expected_type: str) -> bool:
@@ -229,7 +441,9 @@ def types_are_compatible(existing_type: str, expected_type: str) -> bool:
     Check if two database column types are compatible.
 
     This method checks if the existing database column type is compatible
-    with the expected type based on the model field type.
+    with the expected type based on the model field type. Types are
+    compared without their length or precision, e.g. varchar(100) and
+    character varying are compatible.
 
     Args:
         existing_type (str): The existing database column type.
@@ -238,26 +452,10 @@ def types_are_compatible(existing_type: str, expected_type: str) -> bool:
     Returns:
         bool: True if the types are compatible, False otherwise.
     """
-    existing_type = existing_type.lower() if existing_type else ""
-    expected_type = expected_type.lower() if expected_type else ""
-
-    compatible_types = {
-        "int": ["int", "integer", "smallint", "bigint"],
-        "varchar": ["varchar", "char", "text", "nvarchar", "nchar"],
-        "float": ["float", "real", "double precision"],
-        "decimal": ["decimal", "numeric"],
-        "datetime": ["datetime", "timestamp", "date", "time"],
-        "bool": ["bool", "boolean", "bit"],
-    }
-
-    for db_type, compatible_list in compatible_types.items():
-        if (
-            existing_type in compatible_list
-            and expected_type in compatible_list
-        ):
-            return True
-
-    return False
+    existing_group = _TYPE_GROUP.get(normalize_db_type(existing_type))
+    return existing_group is not None and existing_group == _TYPE_GROUP.get(
+        normalize_db_type(expected_type)
+    )
 
 
 def parse_table_name(
@@ -283,69 +481,28 @@ def parse_table_name(
     Returns:
         tuple: (schema, table)
     """
-    if "[" in table_name and "]" in table_name:
-        parts = table_name.split(".", 1)
-        schema = parts[0].strip("[]")
-        table = parts[1].strip("[]")
-    elif "." in table_name:
-        schema, table = table_name.split(".", 1)
-    else:
-        schema = get_default_schema(connection)
-        table = table_name
-    schema = schema.strip('"').strip("'")
-    table = table.strip('"').strip("'")
-    return schema, table
+    return _parse_table_name(get_default_schema(connection), table_name)
 
 
-def get_column_type(
-    connection: BaseDatabaseWrapper,
-    schema: str,
-    table: str,
-    column_name: str,
-) -> str | None:
+@lru_cache(maxsize=512)
+def _parse_table_name(default_schema: str | None, table_name: str) -> tuple:
     """
-    Get the data type of column in the database.
+    Parse the table name into schema and table parts, with caching.
 
     Args:
-        connection (BaseDatabaseWrapper): The database connection.
-        schema (str): The database schema name.
-        table (str): The database table name.
-        column_name (str): The name of the database column.
+        default_schema (str | None): The schema used for unqualified names.
+        table_name (str): the table name to parse
 
     Returns:
-        str: The data type of the column, or None if the column does not
-        exist.
+        tuple: (schema, table)
     """
-    with connection.cursor() as cursor:
-        if connection.vendor == "sqlite":
-            cursor.execute(
-                """
-                SELECT type
-                FROM pragma_table_info(%s)
-                WHERE name = %s
-            """,
-                [table, column_name],
-            )
-        elif connection.vendor == "postgresql":
-            cursor.execute(
-                """
-                SELECT DATA_TYPE
-                FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME = %s
-            """,
-                [schema, table, column_name],
-            )
-        elif connection.vendor == "microsoft":
-            cursor.execute(
-                """
-                SELECT DATA_TYPE
-                FROM INFORMATION_SCHEMA.COLUMNS
-                WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND COLUMN_NAME = %s
-            """,
-                [schema, table, column_name],
-            )
-        result = cursor.fetchone()
-        return result[0] if result else None
+    table_name = table_name.translate(_IDENTIFIER_QUOTES)
+    if "." in table_name:
+        schema, table = table_name.split(".", 1)
+    else:
+        schema = default_schema
+        table = table_name
+    return schema, table
 
 
 def get_formatted_table_name(
@@ -362,40 +519,60 @@ def get_formatted_table_name(
     Returns:
         str: The correctly formatted table name for the specific database.
     """
-    if connection.vendor == "postgresql":
-        return f'"{schema}"."{table}"'
-    elif connection.vendor in ["microsoft", "mssql"]:
-        return f"[{schema}].[{table}]"
-    else:
-        # For other databases, return the unquoted version
-        return f"{schema}.{table}"
+    # For other databases, return the unquoted version
+    table_name_format = _TABLE_NAME_FORMATS.get(
+        connection.vendor, "{schema}.{table}"
+    )
+    return table_name_format.format(schema=schema, table=table)
 
 
-@contextmanager
-def temporary_table_name(
-    model: type[Model], connection: BaseDatabaseWrapper
-) -> str:
+def combine_alter_table_statements(
+    quoted_table_name: str, statements: list[tuple[str, list | None]]
+) -> list[tuple[str, list | None]]:
     """
-    Context manager to temporarily change the db_table name of a model.
+    Combine ALTER TABLE statements for one table into as few as possible.
+
+    All ADD COLUMN actions are combined into one statement, followed by one
+    statement holding the remaining ALTER TABLE actions (e.g. dropping the
+    defaults used to fill existing rows). Any other statements are kept as
+    they are and run afterwards, in their original order.
 
     Args:
-        model (type[Model]): The Django model class.
-        connection (BaseDatabaseWrapper): The database connection.
+        quoted_table_name (str): The quoted table name the statements alter.
+        statements (list[tuple[str, list | None]]): The (sql, params) pairs.
 
-    Yields:
-        str: The formatted table name for the model.
+    Returns:
+        list[tuple[str, list | None]]: The combined (sql, params) pairs.
     """
-    original_db_table = model._meta.db_table
-    if not connection.vendor == "sqlite":
-        schema, table = parse_table_name(connection, original_db_table)
-        formatted_table_name = get_formatted_table_name(
-            connection, schema, table
+    prefix = f"ALTER TABLE {quoted_table_name} "
+    add_actions = []
+    alter_actions = []
+    remaining = []
+    for sql, params in statements:
+        if not sql.startswith(prefix):
+            remaining.append((sql, params))
+        elif sql.startswith("ADD COLUMN ", len(prefix)):
+            add_actions.append((sql[len(prefix) :], params or []))
+        else:
+            alter_actions.append((sql[len(prefix) :], params or []))
+
+    combined = []
+    for actions in (add_actions, alter_actions):
+        if not actions:
+            continue
+        params = [
+            param for _, action_params in actions for param in action_params
+        ]
+        # Literal '%' in actions without params must be escaped once the
+        # combined statement is run with params.
+        sql = prefix + ", ".join(
+            action
+            if action_params or not params
+            else action.replace("%", "%%")
+            for action, action_params in actions
         )
-        model._meta.db_table = formatted_table_name
-    try:
-        yield
-    finally:
-        model._meta.db_table = original_db_table
+        combined.append((sql, params or None))
+    return combined + remaining
 
 
 def restore_foreign_keys(original_settings: list[tuple]) -> None:
@@ -420,11 +597,12 @@ def handle_foreign_keys(model: type[Model]) -> list[tuple]:
     Returns:
         list[tuple]: List of original FK settings to restore
     """
-    if model._meta.managed:
+    opts = model._meta
+    if opts.managed:
         return []
 
     original_settings = []
-    for field in model._meta.fields:
+    for field in opts.fields:
         if isinstance(field, models.ForeignKey):
             original_settings.append(
                 (field, field.db_constraint, field.remote_field.on_delete)
@@ -460,8 +638,15 @@ class Command(BaseCommand):
         """
         super().__init__(stdout, stderr, no_color, force_color)
         self.verbose: bool | None = None
-        self.connection = None
         self.models_to_process = []
+        # Per database alias caches, filled in by process_connection.
+        self._existing_tables: dict[str, set[tuple[str, str]]] = {}
+        self._existing_columns: dict[
+            str, dict[tuple[str, str], dict[str, str]]
+        ] = {}
+        self._db_types: dict[str, dict[tuple, str | None]] = {}
+        self._ensured_schemas: set[tuple[str, str]] = set()
+        self._output_buffer: list[str] = []
 
     def add_arguments(self, parser: CommandParser) -> None:
         """
@@ -480,6 +665,34 @@ class Command(BaseCommand):
             help="Increase output verbosity",
         )
 
+    def write_output(self, message: str) -> None:
+        """
+        Buffer a message for stdout.
+
+        Messages are collected and written in one go by flush_output, which
+        avoids a styled write per model and field in detailed mode. Appending
+        to the buffer is atomic, so it is also safe from worker threads.
+        Errors are still written to stderr straight away.
+
+        Args:
+            message (str): The message to write.
+
+        Returns:
+            None
+        """
+        self._output_buffer.append(f"{message}\n")
+
+    def flush_output(self) -> None:
+        """
+        Write the buffered messages to stdout.
+
+        Returns:
+            None
+        """
+        if self._output_buffer:
+            self.stdout.write("".join(self._output_buffer), ending="")
+            self._output_buffer.clear()
+
     def handle(self, *args: str, **options: dict[str, str]) -> None:
         """
         Handle the management command.
@@ -495,11 +708,21 @@ class Command(BaseCommand):
             None
         """
         self.verbose = options["detailed"]
+        exclude_path = (
+            getattr(settings, "EXCLUDE_UNMANAGED_PATH", None)
+            or get_installed_package_paths()
+        )
+        additional_apps = frozenset(
+            getattr(settings, "ADDITIONAL_UNMANAGED_TABLE_APPS", [])
+        )
         for app_config in apps.get_app_configs():
-            if is_app_eligible(app_config):
+            if is_app_eligible(app_config, exclude_path, additional_apps):
                 self.collect_unmanaged_models(app_config)
 
-        self.process_models()
+        try:
+            self.process_models()
+        finally:
+            self.flush_output()
 
     def collect_unmanaged_models(self, app_config: AppConfig) -> None:
         """
@@ -511,52 +734,146 @@ class Command(BaseCommand):
         Returns:
             None
         """
-        for model in app_config.get_models():
-            if not model._meta.managed:
-                self.models_to_process.append(model)
+        self.models_to_process.extend(
+            model
+            for model in app_config.get_models()
+            if not model._meta.managed
+        )
 
     def process_models(self) -> None:
         """
         Process the unmanaged models.
 
-        This method groups the models by database connection and processes
-        each model for each connection.
+        This method groups the models by database alias and processes the
+        models for each database. Apps in APP_TO_DATABASE_MAPPING use the
+        mapped database, other models use the database the routers select
+        for writes (the default database without routers). Databases are
+        independent of each other, so when more than one is involved they
+        are processed concurrently, each in its own thread and therefore
+        with its own connection.
+
+        The two cases differ in which connection does the work. With a
+        single database, the models are processed on the calling thread's
+        connection, so the DDL joins any transaction the caller has open
+        and the connection stays open afterwards. With several databases,
+        each worker thread opens a new connection, outside of any caller
+        transaction, and closes it once its database has been processed.
 
         Returns:
             None
         """
-        models_by_connection = {}
+        database_mapping = (
+            getattr(settings, "APP_TO_DATABASE_MAPPING", None) or {}
+        )
+        models_by_alias = defaultdict(list)
         for model in self.models_to_process:
-            # Get the default database
-            db_alias = "default"
-            # TODO: Add support for dbrouters if they exist?
-            if settings.APP_TO_DATABASE_MAPPING:
-                db_name = settings.APP_TO_DATABASE_MAPPING.get(
-                    model._meta.app_label
-                )
-                if db_name:
-                    db_alias = db_name
-            connection = connections[db_alias]
-            if connection not in models_by_connection:
-                models_by_connection[connection] = []
-            models_by_connection[connection].append(model)
-
-        # Process models for each connection
-        for connection, models in models_by_connection.items():
-            self.connection = connection
-            with connection.schema_editor() as schema_editor:
-                with ExitStack() as stack:
-                    # Apply temporary table names to all models
-                    for model in models:
-                        stack.enter_context(
-                            temporary_table_name(model, connection)
-                        )
+            # Use the mapped database, falling back to the database routers
+            db_alias = database_mapping.get(
+                model._meta.app_label
+            ) or router.db_for_write(model)
+            models_by_alias[db_alias].append(model)
+
+        if len(models_by_alias) <= 1:
+            for db_alias, models in models_by_alias.items():
+                self.process_connection(connections[db_alias], models)
+            return
+
+        with ThreadPoolExecutor(max_workers=len(models_by_alias)) as executor:
+            futures = [
+                executor.submit(self.process_database, db_alias, models)
+                for db_alias, models in models_by_alias.items()
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+    def process_database(
+        self, db_alias: str, models: list[type[Model]]
+    ) -> None:
+        """
+        Process the models for a database from a worker thread.
+
+        Django connections are thread local, so the connection is looked up
+        and closed within the worker thread.
+
+        Args:
+            db_alias (str): The database alias.
+            models (list[type[Model]]): The models to process.
+
+        Returns:
+            None
+        """
+        connection = connections[db_alias]
+        try:
+            self.process_connection(connection, models)
+        finally:
+            connection.close()
+
+    def process_connection(
+        self, connection: BaseDatabaseWrapper, models: list[type[Model]]
+    ) -> None:
+        """
+        Process the models for a single database connection.
+
+        Args:
+            connection (BaseDatabaseWrapper): The database connection.
+            models (list[type[Model]]): The models to process.
+
+        Returns:
+            None
+        """
+        parsed_tables = {
+            model: parse_table_name(connection, model._meta.db_table)
+            for model in models
+        }
+        tables = set(parsed_tables.values())
+        existing_tables = get_existing_tables(
+            connection, {schema for schema, _ in tables if schema}
+        )
+        self._existing_tables[connection.alias] = existing_tables
+        self._existing_columns[connection.alias] = get_existing_columns(
+            connection, tables & existing_tables
+        )
+        self._db_types[connection.alias] = {}
+        # The schema editor already wraps all of the DDL for this
+        # connection in a single transaction on backends that can roll
+        # back DDL (connection.features.can_rollback_ddl), and executes
+        # it statement by statement where they cannot (e.g. MySQL).
+        with connection.schema_editor(atomic=True) as schema_editor:
+            # Ensure the schemas exist, once per schema on each connection
+            schemas = sorted(
+                schema
+                for schema in {schema for schema, _ in tables if schema}
+                if (connection.alias, schema) not in self._ensured_schemas
+            )
+            create_schemas_if_not_exist(connection, schemas)
+            self._ensured_schemas.update(
+                (connection.alias, schema) for schema in schemas
+            )
 
-                    # Now process each model
+            # Apply the formatted table names to every model whose name
+            # changes, so that foreign keys between the models reference
+            # the formatted names too. SQLite table names are used as they
+            # are.
+            original_db_tables = {}
+            try:
+                if connection.vendor != "sqlite":
                     for model in models:
-                        self.create_table_for_model(
-                            connection, schema_editor, model
+                        opts = model._meta
+                        formatted_table_name = get_formatted_table_name(
+                            connection, *parsed_tables[model]
                         )
+                        if formatted_table_name != opts.db_table:
+                            original_db_tables[opts] = opts.db_table
+                            opts.db_table = formatted_table_name
+
+                for model in models:
+                    schema, table = parsed_tables[model]
+                    self.create_table_for_model(
+                        connection, schema_editor, model, schema, table
+                    )
+            finally:
+                for opts, db_table in original_db_tables.items():
+                    opts.db_table = db_table
 
     def create_model_table(
         self,
@@ -577,13 +894,16 @@ class Command(BaseCommand):
         Returns:
             bool: True if table created or exists, False if error
         """
-        if not table_exists(self.connection, schema, table):
+        connection = schema_editor.connection
+        existing_tables = self._existing_tables[connection.alias]
+        if (schema, table) not in existing_tables:
             if self.verbose:
-                self.stdout.write(
+                self.write_output(
                     self.style.SUCCESS(f"Creating table for {model.__name__}")
                 )
             try:
                 schema_editor.create_model(model)
+                existing_tables.add((schema, table))
                 return True
             except ProgrammingError as e:
                 self.stderr.write(
@@ -594,7 +914,7 @@ class Command(BaseCommand):
                 return False
         else:
             if self.verbose:
-                self.stdout.write(
+                self.write_output(
                     self.style.SUCCESS(
                         f"Table for {model.__name__} already exists"
                     )
@@ -606,40 +926,66 @@ class Command(BaseCommand):
         connection: BaseDatabaseWrapper,
         schema_editor: BaseDatabaseSchemaEditor,
         model: type[Model],
+        schema: str,
+        table: str,
     ) -> None:
         """
         Create a table for the given model if it does not exist.
 
         For unmanaged models, creates FKs without database constraints.
+
+        Args:
+            connection: The database connection
+            schema_editor: The schema editor
+            model: The model to create a table for
+            schema: Database schema name, as parsed from the model
+            table: Table name, as parsed from the model
         """
         # Handle FK constraints for unmanaged models
         original_fk_settings = handle_foreign_keys(model)
 
         try:
-            # Get table info
-            table_name = model._meta.db_table
-            schema, table = parse_table_name(self.connection, table_name)
-
             if self.verbose:
-                self.stdout.write(
+                self.write_output(
                     f"Processing table '{table}' in schema '{schema}'"
                 )
 
-            # Ensure schema exists
-            if schema:
-                create_schema_if_not_exists(self.connection, schema)
-
             # Create table if needed
+            table_exists = (schema, table) in self._existing_tables[
+                connection.alias
+            ]
             if not self.create_model_table(
                 schema_editor, model, schema, table
             ):
                 return
 
-            # Process fields
-            for field in model._meta.fields:
-                self.process_field(
-                    connection, schema_editor, model, schema, table, field
+            # A freshly created table already has every column
+            if not table_exists:
+                return
+
+            # Process fields, reusing the FKs found by handle_foreign_keys.
+            # Only unmanaged models have their FKs collected there, so any
+            # other field is left for get_column_name to check by type.
+            foreign_keys = {field for field, _, _ in original_fk_settings}
+            field_specs = [
+                (
+                    field,
+                    get_column_name(
+                        field, True if field in foreign_keys else None
+                    ),
+                )
+                for field in model._meta.concrete_fields
+            ]
+            missing_fields = [
+                (field, column_name)
+                for field, column_name in field_specs
+                if self.process_field(
+                    connection, model, schema, table, field, column_name
                 )
+            ]
+
+            # Add any missing columns
+            self.add_fields(schema_editor, model, missing_fields)
 
         finally:
             # Restore original FK settings
@@ -648,68 +994,164 @@ class Command(BaseCommand):
     def process_field(
         self,
         connection: BaseDatabaseWrapper,
-        schema_editor: BaseDatabaseSchemaEditor,
         model: type[Model],
         schema: str,
         table: str,
         field: Field,
-    ) -> None:
-        """Process a field for the given model and table."""
-        # Get the base column name from the field
-        column_name = field.db_column or field.name
+        column_name: str,
+    ) -> bool:
+        """
+        Process a field for the given model and table.
 
-        # For foreign key fields, be smarter about the column name
-        if isinstance(field, models.ForeignKey):
-            # If db_column is set, use it exactly as specified
-            if field.db_column:
-                column_name = field.db_column
-            # If no db_column is set, append '_id' only if it's not already there
-            elif not column_name.endswith("_id"):
-                column_name += "_id"
+        Missing columns are reported back rather than added here, so that
+        all of a table's missing columns can be added together.
+
+        Args:
+            connection: The database connection
+            model: The model the field belongs to
+            schema: Database schema name
+            table: Table name
+            field: The field to process
+            column_name: The name of the field's column
 
+        Returns:
+            bool: True if the column is missing from the table, otherwise
+            False.
+        """
         if self.verbose:
-            self.stdout.write(
+            self.write_output(
                 f"Checking column '{column_name}' in schema '{schema}', table '{table}'"
             )
 
-        if not column_exists(connection, schema, table, column_name):
+        existing_columns = self._existing_columns[connection.alias].get(
+            (schema, table), {}
+        )
+        if column_name not in existing_columns:
             if self.verbose:
-                self.stdout.write(
+                self.write_output(
                     self.style.SUCCESS(
                         f"Adding column {column_name} to {model.__name__}"
                     )
                 )
-            try:
-                # Store original db_column
-                original_db_column = field.db_column
-                # Temporarily set db_column to match what we want
-                field.db_column = column_name
+            return True
+
+        if self.verbose:
+            self.check_column_compatibility(
+                connection,
+                model,
+                field,
+                column_name,
+                existing_columns[column_name],
+            )
+        return False
 
-                schema_editor.add_field(model, field)
+    def add_fields(
+        self,
+        schema_editor: BaseDatabaseSchemaEditor,
+        model: type[Model],
+        fields: list[tuple[Field, str]],
+    ) -> None:
+        """
+        Add the columns for the given fields to the model's table.
 
-                # Restore original db_column
-                field.db_column = original_db_column
+        On PostgreSQL the statements generated for each field are combined
+        so that all of the columns are added with a single ALTER TABLE.
+        Because that statement either succeeds or fails as a whole, a
+        single column that cannot be added means that none of the table's
+        columns are added. Other backends add the columns one at a time.
 
-            except Exception as e:
-                self.stderr.write(
-                    self.style.ERROR(
-                        f"Error adding column {column_name}: {str(e)}"
-                    )
+        Args:
+            schema_editor: The schema editor
+            model: The model to add the columns to
+            fields: The (field, column_name) pairs to add
+
+        Returns:
+            None
+        """
+        if schema_editor.connection.vendor != "postgresql" or len(fields) < 2:
+            for field, column_name in fields:
+                self.add_field(schema_editor, model, field, column_name)
+            return
+
+        # Collect the SQL Django generates for each field instead of
+        # running it straight away, the same way sqlmigrate does. The
+        # collected statements have their params already interpolated.
+        collect_sql = schema_editor.collect_sql
+        collected_sql = getattr(schema_editor, "collected_sql", None)
+        schema_editor.collect_sql = True
+        schema_editor.collected_sql = []
+        try:
+            for field, column_name in fields:
+                self.add_field(schema_editor, model, field, column_name)
+            statements = [
+                (sql.rstrip().removesuffix(";"), None)
+                for sql in schema_editor.collected_sql
+            ]
+        finally:
+            schema_editor.collect_sql = collect_sql
+            if collected_sql is None:
+                del schema_editor.collected_sql
+            else:
+                schema_editor.collected_sql = collected_sql
+
+        quoted_table_name = schema_editor.quote_name(model._meta.db_table)
+        try:
+            for sql, params in combine_alter_table_statements(
+                quoted_table_name, statements
+            ):
+                schema_editor.execute(sql, params)
+        except Exception as e:
+            column_names = ", ".join(column_name for _, column_name in fields)
+            self.stderr.write(
+                self.style.ERROR(
+                    f"Error adding columns {column_names}: {str(e)}"
                 )
-        else:
-            if self.verbose:
-                self.check_column_compatibility(
-                    connection, model, schema, table, field, column_name
+            )
+
+    def add_field(
+        self,
+        schema_editor: BaseDatabaseSchemaEditor,
+        model: type[Model],
+        field: Field,
+        column_name: str,
+    ) -> None:
+        """
+        Add the column for a field to the model's table.
+
+        Args:
+            schema_editor: The schema editor
+            model: The model to add the column to
+            field: The field to add
+            column_name: The name of the column to add
+
+        Returns:
+            None
+        """
+        try:
+            # Store original db_column
+            original_db_column = field.db_column
+            # Temporarily set db_column to match what we want
+            field.db_column = column_name
+
+            schema_editor.add_field(model, field)
+
+            # Restore original db_column
+            field.db_column = original_db_column
+
+        except Exception as e:
+            self.stderr.write(
+                self.style.ERROR(
+                    f"Error adding column {column_name}: {str(e)}"
                 )
+            )
 
     def check_column_compatibility(
         self,
         connection: BaseDatabaseWrapper,
         model: type[Model],
-        schema: str,
-        table: str,
         field: Field,
         column_name: str,
+        existing_type: str | None,
     ) -> None:
         """
         Check if existing database column type is compatible with the field.
@@ -722,10 +1164,10 @@ class Command(BaseCommand):
             connection (BaseDatabaseWrapper): The database
             connection.
             model (type[Model]): The Django model class containing the field.
-            schema (str): The database schema name.
-            table (str): The database table name.
             field (Field): The Django model field to check.
             column_name (str): The name of the database column.
+            existing_type (str | None): The type of the existing column, as
+                fetched with the table's columns.
 
         Returns:
             None
@@ -733,17 +1175,18 @@ class Command(BaseCommand):
         Side effects:
             Writes output to self.stdout using self.style for formatting.
         """
-        existing_type = get_column_type(connection, schema, table, column_name)
-        expected_type = get_field_db_type(connection, field)
+        expected_type = get_field_db_type(
+            connection, field, self._db_types.setdefault(connection.alias, {})
+        )
         if not types_are_compatible(existing_type, expected_type):
-            self.stdout.write(
+            self.write_output(
                 self.style.WARNING(
                     f"Column {column_name} in {model.__name__} has type {existing_type}, "  # noqa: E501
                     f"but the model field type is {expected_type}. Consider manual migration."  # noqa: E501
                 )
             )
         else:
-            self.stdout.write(
+            self.write_output(
                 self.style.SUCCESS(
                     f"Column {column_name} exists in {model.__name__} with compatible type {existing_type}"  # noqa: E501
                 )
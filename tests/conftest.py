@@ -1,21 +1,33 @@
 """Test configuration for django_unmanaged_assistant."""
 
 import os
+import sys
 from collections.abc import Generator
 from io import StringIO
+from types import ModuleType
 from typing import Any
+from unittest.mock import Mock
 
 import django
 import pytest
+from django.apps import AppConfig
 from django.conf import settings
 from django.core import management
 from django.db import connections
 from django.db.backends.base.base import BaseDatabaseWrapper
 
+from django_unmanaged_assistant.management.commands import create_databases
+
 # Configure Django settings before importing models
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.test_settings")
 django.setup()
 
+# Register the management command for testing. get_commands() is cached,
+# so this registration lasts for the whole session.
+management.get_commands()["create_unmanaged_tables"] = (
+    "django_unmanaged_assistant"
+)
+
 # Now we can import models
 from tests.test_app.models import (
     MixedUnmanagedModel,
@@ -29,13 +41,6 @@ from tests.test_app.models import (
 )
 
 
-@pytest.fixture(autouse=True)
-def setup_management_command() -> None:
-    """Register the management command for testing."""
-    commands = management.get_commands()
-    commands["create_unmanaged_tables"] = "django_unmanaged_assistant"
-
-
 def pytest_configure() -> None:
     """Configure Django settings for tests."""
     pass
@@ -44,10 +49,15 @@ def pytest_configure() -> None:
 @pytest.fixture(scope="session")
 def django_db_setup() -> None:
     """Configure database for tests."""
-    settings.DATABASES["default"] = {
+    test_database = {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
     }
+    # The test settings already use this database, so only replace it when
+    # they have been overridden.
+    default = settings.DATABASES["default"]
+    if any(default.get(key) != value for key, value in test_database.items()):
+        settings.DATABASES["default"] = test_database
 
 
 @pytest.fixture
@@ -87,15 +97,15 @@ def stderr() -> Generator[StringIO, None, None]:
     output.close()
 
 
-@pytest.fixture
-def unmanaged_models() -> list[Any]:
+@pytest.fixture(scope="session")
+def unmanaged_models() -> tuple[Any, ...]:
     """
     Fixture providing all unmanaged test models.
 
     Returns:
-        List[Any]: List of unmanaged model classes.
+        Tuple[Any, ...]: Tuple of unmanaged model classes.
     """
-    return [
+    return (
         MixedUnmanagedModel,
         MixedUnmanagedModelNC,
         MixedUnmanagedModelWithFk,
@@ -104,4 +114,70 @@ def unmanaged_models() -> list[Any]:
         MixedUnmanagedModelDottedTableNC,
         MixedUnmanagedSchemaModel,
         MixedUnmanagedSchemaModelNC,
-    ]
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_unmanaged_app_config(unmanaged_models: tuple[Any, ...]) -> Mock:
+    """
+    Fixture providing a mock app config holding the unmanaged test models.
+
+    Args:
+        unmanaged_models: Tuple of unmanaged model classes.
+
+    Returns:
+        Mock: Mock app configuration for the test app.
+    """
+    mock_app_config = Mock(spec=AppConfig)
+    mock_app_config.path = "/path/to/app"
+    mock_app_config.name = "test_app"
+    mock_app_config.get_models.return_value = unmanaged_models
+    return mock_app_config
+
+
+@pytest.fixture
+def fake_drivers(monkeypatch: pytest.MonkeyPatch) -> dict[str, ModuleType]:
+    """
+    Fixture replacing the database drivers with fake modules.
+
+    Each fake driver has its own Error class and a Mock connect function.
+    The connections it returns give cursors reporting that no database
+    exists yet.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture.
+
+    Returns:
+        dict[str, ModuleType]: The fake psycopg2, MySQLdb and pyodbc
+            modules, keyed by name.
+    """
+    modules = {}
+    drivers = {}
+    for name in ("psycopg2", "MySQLdb", "pyodbc"):
+        driver = ModuleType(name)
+        driver.Error = type("Error", (Exception,), {})
+        driver.connect = Mock(name=f"{name}.connect")
+        cursor = driver.connect.return_value.cursor.return_value
+        cursor.fetchone.return_value = None if name == "psycopg2" else (1,)
+        cursor.nextset.return_value = None
+        modules[name] = drivers[name] = driver
+
+    modules["psycopg2.extensions"] = ModuleType("psycopg2.extensions")
+    modules["psycopg2.extensions"].ISOLATION_LEVEL_AUTOCOMMIT = 0
+    # Composed SQL is rendered straight to a string
+    modules["psycopg2.sql"] = ModuleType("psycopg2.sql")
+    modules["psycopg2.sql"].SQL = str
+    modules["psycopg2.sql"].Identifier = lambda name: '"{}"'.format(
+        name.replace('"', '""')
+    )
+    modules["MySQLdb.constants"] = ModuleType("MySQLdb.constants")
+    modules["MySQLdb.constants.CLIENT"] = ModuleType(
+        "MySQLdb.constants.CLIENT"
+    )
+    modules["MySQLdb.constants.CLIENT"].MULTI_STATEMENTS = 1 << 16
+
+    for name, module in modules.items():
+        monkeypatch.setitem(sys.modules, name, module)
+    # Drop any driver imported by an earlier test
+    monkeypatch.setattr(create_databases, "_drivers", {})
+    return drivers
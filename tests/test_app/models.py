@@ -34,7 +34,7 @@ class MixedManagedModel(models.Model):
 
     def __str__(self) -> str:
         """Return name."""
-        return f"{self.name}"
+        return self.name
 
 
 class MixedManagedModelWithId(models.Model):
@@ -52,7 +52,7 @@ class MixedManagedModelWithId(models.Model):
 
     def __str__(self) -> str:
         """Return name."""
-        return f"{self.name}"
+        return self.name
 
 
 class MixedManagedModelWithFk(models.Model):
@@ -71,7 +71,7 @@ class MixedManagedModelWithFk(models.Model):
 
     def __str__(self) -> str:
         """Return name."""
-        return f"{self.name}"
+        return self.name
 
 
 class MixedUnmanagedModelNC(models.Model):
@@ -90,7 +90,7 @@ class MixedUnmanagedModelNC(models.Model):
 
     def __str__(self) -> str:
         """Return name."""
-        return f"{self.name}"
+        return self.name
 
 
 class MixedUnmanagedModelWithFkNC(models.Model):
@@ -112,7 +112,7 @@ class MixedUnmanagedModelWithFkNC(models.Model):
 
     def __str__(self) -> str:
         """Return name."""
-        return f"{self.name}"
+        return self.name
 
 
 class MixedUnmanagedModelDottedTableNC(models.Model):
@@ -131,7 +131,7 @@ class MixedUnmanagedModelDottedTableNC(models.Model):
 
     def __str__(self) -> str:
         """Return name."""
-        return f"{self.name}"
+        return self.name
 
 
 class MixedUnmanagedSchemaModelNC(models.Model):
@@ -150,7 +150,7 @@ class MixedUnmanagedSchemaModelNC(models.Model):
 
     def __str__(self) -> str:
         """Return name."""
-        return f"{self.name}"
+        return self.name
 
 
 class MixedUnmanagedModel(models.Model):
@@ -169,7 +169,7 @@ class MixedUnmanagedModel(models.Model):
 
     def __str__(self) -> str:
         """Return name."""
-        return f"{self.name}"
+        return self.name
 
 
 class MixedUnmanagedModelWithFk(models.Model):
@@ -193,7 +193,7 @@ class MixedUnmanagedModelWithFk(models.Model):
 
     def __str__(self) -> str:
         """Return name."""
-        return f"{self.name}"
+        return self.name
 
 
 class MixedUnmanagedModelDottedTable(models.Model):
@@ -212,7 +212,7 @@ class MixedUnmanagedModelDottedTable(models.Model):
 
     def __str__(self) -> str:
         """Return name."""
-        return f"{self.name}"
+        return self.name
 
 
 class MixedUnmanagedSchemaModel(models.Model):
@@ -231,4 +231,4 @@ class MixedUnmanagedSchemaModel(models.Model):
 
     def __str__(self) -> str:
         """Return name."""
-        return f"{self.name}"
+        return self.name
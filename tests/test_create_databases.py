@@ -0,0 +1,382 @@
+"""Tests for create_databases management command."""
+
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+from types import ModuleType
+
+import pytest
+from pytest_mock import MockerFixture
+
+from django_unmanaged_assistant.management.commands.create_databases import (
+    Command,
+)
+
+MODULE = "django_unmanaged_assistant.management.commands.create_databases"
+
+
+def run_command(
+    mocker: MockerFixture, databases: dict[str, dict]
+) -> tuple[str, str]:
+    """
+    Run the command against the given DATABASES setting.
+
+    Args:
+        mocker: Pytest mocker fixture.
+        databases: The DATABASES setting to create the databases of.
+
+    Returns:
+        tuple[str, str]: The stdout and stderr output of the command.
+    """
+    mocker.patch(f"{MODULE}.settings", DATABASES=databases)
+    stdout = StringIO()
+    stderr = StringIO()
+    Command(stdout=stdout, stderr=stderr).handle()
+    return stdout.getvalue(), stderr.getvalue()
+
+
+def mysql_database(name: str) -> dict[str, str]:
+    """
+    Build the settings of a MySQL database.
+
+    Args:
+        name: The name of the database.
+
+    Returns:
+        dict[str, str]: The database settings.
+    """
+    return {
+        "ENGINE": "django.db.backends.mysql",
+        "NAME": name,
+        "USER": "user",
+        "HOST": "db",
+    }
+
+
+def postgresql_database(name: str, host: str = "db") -> dict[str, str]:
+    """
+    Build the settings of a PostgreSQL database.
+
+    Args:
+        name: The name of the database.
+        host: The host of the database server.
+
+    Returns:
+        dict[str, str]: The database settings.
+    """
+    return {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": name,
+        "USER": "user",
+        "HOST": host,
+        "PORT": "5432",
+    }
+
+
+class TestServerConnections:
+    """Tests for connecting to the database servers."""
+
+    def test_one_connection_per_server(
+        self, mocker: MockerFixture, fake_drivers: dict[str, ModuleType]
+    ) -> None:
+        """
+        Test that databases on the same server share one connection.
+
+        Args:
+            mocker: Pytest mocker fixture.
+            fake_drivers: The fake database driver modules.
+        """
+        psycopg2 = fake_drivers["psycopg2"]
+        stdout, stderr = run_command(
+            mocker,
+            {
+                "default": postgresql_database("a"),
+                "other": postgresql_database("b"),
+            },
+        )
+
+        psycopg2.connect.assert_called_once()
+        conn = psycopg2.connect.return_value
+        conn.close.assert_called_once()
+        executed = [
+            call.args[0] for call in conn.cursor().execute.call_args_list
+        ]
+        assert 'CREATE DATABASE "a"' in executed
+        assert 'CREATE DATABASE "b"' in executed
+        assert "Created PostgreSQL database 'a'" in stdout
+        assert "Created PostgreSQL database 'b'" in stdout
+        assert stderr == ""
+
+    def test_connect_failure_reported_per_database(
+        self, mocker: MockerFixture, fake_drivers: dict[str, ModuleType]
+    ) -> None:
+        """
+        Test that a failed connection is reported for each database.
+
+        Args:
+            mocker: Pytest mocker fixture.
+            fake_drivers: The fake database driver modules.
+        """
+        psycopg2 = fake_drivers["psycopg2"]
+        psycopg2.connect.side_effect = psycopg2.Error("connection refused")
+
+        _, stderr = run_command(
+            mocker,
+            {
+                "default": postgresql_database("a"),
+                "other": postgresql_database("b"),
+            },
+        )
+
+        assert "Error creating database 'default': connection refused" in (
+            stderr
+        )
+        assert "Error creating database 'other': connection refused" in (
+            stderr
+        )
+
+    def test_servers_processed_concurrently(
+        self, mocker: MockerFixture, fake_drivers: dict[str, ModuleType]
+    ) -> None:
+        """
+        Test that the databases of several servers are all created.
+
+        Args:
+            mocker: Pytest mocker fixture.
+            fake_drivers: The fake database driver modules.
+        """
+        executor = mocker.patch(
+            f"{MODULE}.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        )
+
+        stdout, stderr = run_command(
+            mocker,
+            {
+                "default": postgresql_database("a", host="one"),
+                "other": postgresql_database("b", host="two"),
+                "mssql": {
+                    "ENGINE": "mssql",
+                    "NAME": "c",
+                    "HOST": "three",
+                },
+            },
+        )
+
+        executor.assert_called_once_with(max_workers=3)
+        hosts = {
+            call.kwargs["host"]
+            for call in fake_drivers["psycopg2"].connect.call_args_list
+        }
+        assert hosts == {"one", "two"}
+        fake_drivers["pyodbc"].connect.assert_called_once()
+        assert "Created PostgreSQL database 'a'" in stdout
+        assert "Created PostgreSQL database 'b'" in stdout
+        assert "Created SQL Server database 'c'" in stdout
+        assert stderr == ""
+
+    def test_invalid_settings_reported_per_database(
+        self, mocker: MockerFixture, fake_drivers: dict[str, ModuleType]
+    ) -> None:
+        """
+        Test that invalid settings are reported before connecting.
+
+        Args:
+            mocker: Pytest mocker fixture.
+            fake_drivers: The fake database driver modules.
+        """
+        mysql = {"ENGINE": "django.db.backends.mysql", "HOST": "db"}
+
+        _, stderr = run_command(
+            mocker,
+            {
+                "default": {**mysql, "NAME": "a", "PORT": "port"},
+                "other": {**mysql, "NAME": "b", "PORT": "port"},
+                "pg": postgresql_database("c"),
+            },
+        )
+
+        assert "Error creating database 'default': Invalid port" in stderr
+        assert "Error creating database 'other': Invalid port" in stderr
+        assert "'pg'" not in stderr
+        fake_drivers["MySQLdb"].connect.assert_not_called()
+
+    def test_empty_mysql_port_uses_default(
+        self, mocker: MockerFixture, fake_drivers: dict[str, ModuleType]
+    ) -> None:
+        """
+        Test that an empty MySQL PORT falls back to the default port.
+
+        Args:
+            mocker: Pytest mocker fixture.
+            fake_drivers: The fake database driver modules.
+        """
+        _, stderr = run_command(
+            mocker,
+            {
+                "default": {
+                    "ENGINE": "django.db.backends.mysql",
+                    "NAME": "a",
+                    "PORT": "",
+                },
+            },
+        )
+
+        assert stderr == ""
+        connect = fake_drivers["MySQLdb"].connect
+        assert connect.call_args.kwargs["port"] == 3306
+
+
+class TestDatabaseCreation:
+    """Tests for creating the databases on a server."""
+
+    def test_postgresql_name_quoted(
+        self, mocker: MockerFixture, fake_drivers: dict[str, ModuleType]
+    ) -> None:
+        """
+        Test that PostgreSQL database names are quoted as identifiers.
+
+        Args:
+            mocker: Pytest mocker fixture.
+            fake_drivers: The fake database driver modules.
+        """
+        cursor = fake_drivers["psycopg2"].connect.return_value.cursor()
+
+        run_command(
+            mocker, {"default": postgresql_database('Mixed"Case; DROP x')}
+        )
+
+        assert cursor.execute.call_args.args == (
+            'CREATE DATABASE "Mixed""Case; DROP x"',
+        )
+
+    def test_errors_reported_per_database(
+        self, mocker: MockerFixture, fake_drivers: dict[str, ModuleType]
+    ) -> None:
+        """
+        Test that an error creating one database does not stop the others.
+
+        Args:
+            mocker: Pytest mocker fixture.
+            fake_drivers: The fake database driver modules.
+        """
+        psycopg2 = fake_drivers["psycopg2"]
+
+        def execute(sql: str, params: tuple | None = None) -> None:
+            if sql == 'CREATE DATABASE "a"':
+                raise psycopg2.Error("permission denied")
+
+        cursor = psycopg2.connect.return_value.cursor.return_value
+        cursor.execute.side_effect = execute
+
+        stdout, stderr = run_command(
+            mocker,
+            {
+                "default": postgresql_database("a"),
+                "other": postgresql_database("b"),
+            },
+        )
+
+        assert stderr.strip() == (
+            "Error creating database 'default': permission denied"
+        )
+        assert "Created PostgreSQL database 'a'" not in stdout
+        assert "Created PostgreSQL database 'b'" in stdout
+
+    @pytest.mark.parametrize("name", ["a]; DROP DATABASE b", "a\n"])
+    def test_invalid_name_reported(
+        self,
+        mocker: MockerFixture,
+        fake_drivers: dict[str, ModuleType],
+        name: str,
+    ) -> None:
+        """
+        Test that invalid SQL Server database names are not used.
+
+        Args:
+            mocker: Pytest mocker fixture.
+            fake_drivers: The fake database driver modules.
+            name: The invalid database name.
+        """
+        _, stderr = run_command(
+            mocker, {"default": {"ENGINE": "mssql", "NAME": name}}
+        )
+
+        assert "Error creating database 'default': Invalid database name" in (
+            stderr
+        )
+        cursor = fake_drivers["pyodbc"].connect.return_value.cursor()
+        cursor.execute.assert_not_called()
+
+    def test_mysql_multi_statements_only_for_batches(
+        self, mocker: MockerFixture, fake_drivers: dict[str, ModuleType]
+    ) -> None:
+        """
+        Test that multiple statements are only enabled for batches.
+
+        Args:
+            mocker: Pytest mocker fixture.
+            fake_drivers: The fake database driver modules.
+        """
+        connect = fake_drivers["MySQLdb"].connect
+
+        run_command(mocker, {"default": mysql_database("a")})
+        assert "client_flag" not in connect.call_args.kwargs
+
+        run_command(
+            mocker,
+            {"default": mysql_database("a"), "other": mysql_database("b")},
+        )
+        assert connect.call_args.kwargs["client_flag"] == 1 << 16
+
+    def test_mysql_batch_failure_reported_for_failed_database(
+        self, mocker: MockerFixture, fake_drivers: dict[str, ModuleType]
+    ) -> None:
+        """
+        Test that a failed statement in a batch only fails its database.
+
+        Args:
+            mocker: Pytest mocker fixture.
+            fake_drivers: The fake database driver modules.
+        """
+        mysqldb = fake_drivers["MySQLdb"]
+        cursor = mysqldb.connect.return_value.cursor.return_value
+        # The second statement of the first batch fails, the retried
+        # batch holding the last database succeeds.
+        cursor.nextset.side_effect = [mysqldb.Error("access denied"), None]
+
+        stdout, stderr = run_command(
+            mocker,
+            {
+                "default": mysql_database("a"),
+                "other": mysql_database("b"),
+                "third": mysql_database("c"),
+            },
+        )
+
+        assert stderr.strip() == (
+            "Error creating database 'other': access denied"
+        )
+        assert "MySQL database 'a'" in stdout
+        assert "MySQL database 'b'" not in stdout
+        assert "MySQL database 'c'" in stdout
+        assert [call.args[0] for call in cursor.execute.call_args_list] == [
+            "CREATE DATABASE IF NOT EXISTS `a`; "
+            "CREATE DATABASE IF NOT EXISTS `b`; "
+            "CREATE DATABASE IF NOT EXISTS `c`",
+            "CREATE DATABASE IF NOT EXISTS `c`",
+        ]
+
+    def test_mysql_name_with_newline_rejected(
+        self, mocker: MockerFixture, fake_drivers: dict[str, ModuleType]
+    ) -> None:
+        """
+        Test that MySQL database names must match in full.
+
+        Args:
+            mocker: Pytest mocker fixture.
+            fake_drivers: The fake database driver modules.
+        """
+        _, stderr = run_command(mocker, {"default": mysql_database("a\n")})
+
+        assert "'default': Invalid database name" in stderr
+        cursor = fake_drivers["MySQLdb"].connect.return_value.cursor()
+        cursor.execute.assert_not_called()
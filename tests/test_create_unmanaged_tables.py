@@ -1,51 +1,44 @@
 """Tests for django_unmanaged_tables management command."""
 
 from io import StringIO
+from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 from django.apps import AppConfig
 from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.backends.sqlite3.schema import (
+    DatabaseSchemaEditor as SQLiteSchemaEditor,
+)
+from django.db.utils import ConnectionHandler, ConnectionRouter
+from pytest_django import DjangoDbBlocker, Settings
 from pytest_mock import MockerFixture
 
 from django_unmanaged_assistant.management.commands.create_unmanaged_tables import (
     Command,
+    combine_alter_table_statements,
     create_schema_if_not_exists,
+    create_schemas_if_not_exist,
+    get_column_name,
+    get_existing_columns,
+    get_existing_tables,
+    get_field_db_type,
+    is_app_eligible,
     parse_table_name,
+    types_are_compatible,
 )
 from tests.test_app.models import (
     MixedManagedModel,
+    MixedManagedModelWithFk,
     MixedUnmanagedModel,
     MixedUnmanagedModelDottedTable,
-    MixedUnmanagedModelDottedTableNC,
     MixedUnmanagedModelNC,
     MixedUnmanagedModelWithFk,
-    MixedUnmanagedModelWithFkNC,
     MixedUnmanagedSchemaModel,
-    MixedUnmanagedSchemaModelNC,
 )
 
 
-@pytest.fixture
-def unmanaged_models() -> list[type]:
-    """
-    Fixture providing all unmanaged test models.
-
-    Returns:
-        List[type]: List of unmanaged model classes.
-    """
-    return [
-        MixedUnmanagedModel,
-        MixedUnmanagedModelNC,
-        MixedUnmanagedModelWithFk,
-        MixedUnmanagedModelWithFkNC,
-        MixedUnmanagedModelDottedTable,
-        MixedUnmanagedModelDottedTableNC,
-        MixedUnmanagedSchemaModel,
-        MixedUnmanagedSchemaModelNC,
-    ]
-
-
 class TestModelProcessing:
     """Tests for processing different types of models."""
 
@@ -69,7 +62,8 @@ class TestModelProcessing:
     def test_unmanaged_models_collected(
         self,
         connection: BaseDatabaseWrapper,
-        unmanaged_models: list[type],
+        unmanaged_models: tuple[type, ...],
+        mock_unmanaged_app_config: Mock,
         mocker: MockerFixture,
     ) -> None:
         """
@@ -77,16 +71,133 @@ class TestModelProcessing:
 
         Args:
             connection: Database connection fixture.
-            unmanaged_models: List of unmanaged model classes.
+            unmanaged_models: Tuple of unmanaged model classes.
+            mock_unmanaged_app_config: Mock app config of the test app.
             mocker: Pytest mocker fixture.
         """
         command = Command()
-        mock_app_config = Mock(spec=AppConfig)
-        mock_app_config.get_models.return_value = unmanaged_models
 
-        command.collect_unmanaged_models(mock_app_config)
+        command.collect_unmanaged_models(mock_unmanaged_app_config)
         assert len(command.models_to_process) == len(unmanaged_models)
 
+    def test_models_grouped_by_router(
+        self, unmanaged_models: tuple[type, ...], mocker: MockerFixture
+    ) -> None:
+        """
+        Test that unmapped models use the database chosen by the routers.
+
+        Args:
+            unmanaged_models: Tuple of unmanaged model classes.
+            mocker: Pytest mocker fixture.
+        """
+        db_for_write = mocker.patch(
+            "django_unmanaged_assistant.management.commands."
+            "create_unmanaged_tables.router.db_for_write",
+            return_value="default",
+        )
+        command = Command()
+        process_connection = mocker.patch.object(command, "process_connection")
+        command.models_to_process = unmanaged_models
+
+        command.process_models()
+
+        assert db_for_write.call_count == len(unmanaged_models)
+        process_connection.assert_called_once()
+        assert process_connection.call_args.args[1] == list(unmanaged_models)
+
+    def test_mapped_models_skip_router(
+        self,
+        unmanaged_models: tuple[type, ...],
+        mocker: MockerFixture,
+        settings: Settings,
+    ) -> None:
+        """
+        Test that APP_TO_DATABASE_MAPPING takes precedence over the routers.
+
+        Args:
+            unmanaged_models: Tuple of unmanaged model classes.
+            mocker: Pytest mocker fixture.
+            settings: Django settings fixture.
+        """
+        settings.APP_TO_DATABASE_MAPPING = {"test_app": "other"}
+        db_for_write = mocker.patch(
+            "django_unmanaged_assistant.management.commands."
+            "create_unmanaged_tables.router.db_for_write"
+        )
+        command = Command()
+        process_connection = mocker.patch.object(command, "process_connection")
+        command.models_to_process = unmanaged_models
+        mocker.patch(
+            "django_unmanaged_assistant.management.commands."
+            "create_unmanaged_tables.connections",
+            {"other": "other_connection"},
+        )
+
+        command.process_models()
+
+        db_for_write.assert_not_called()
+        process_connection.assert_called_once_with(
+            "other_connection", list(unmanaged_models)
+        )
+
+    @pytest.mark.parametrize(
+        ("path", "eligible"),
+        [
+            ("/project/test_app", True),
+            ("/project/site-packages-app", True),
+            ("/venv/lib/site-packages/other_app", False),
+            ("/usr/lib/dist-packages/other_app", False),
+        ],
+    )
+    def test_app_eligibility_by_prefix(
+        self, path: str, eligible: bool
+    ) -> None:
+        """
+        Test that apps are excluded by installed package path prefixes.
+
+        Args:
+            path: Path of the app.
+            eligible: Whether the app should be eligible.
+        """
+        mock_app_config = Mock(spec=AppConfig)
+        mock_app_config.path = path
+        mock_app_config.name = "other_app"
+        prefixes = ("/venv/lib/site-packages/", "/usr/lib/dist-packages/")
+
+        assert (
+            is_app_eligible(mock_app_config, prefixes, frozenset()) is eligible
+        )
+
+    @pytest.mark.parametrize(
+        ("path", "name", "eligible"),
+        [
+            ("/project/test_app", "test_app", True),
+            ("/venv/site-packages/other_app", "other_app", False),
+            ("/venv/site-packages/extra_app", "pkg.extra_app", True),
+        ],
+    )
+    def test_app_eligibility(
+        self, path: str, name: str, eligible: bool
+    ) -> None:
+        """
+        Test that apps are filtered by path and additional app names.
+
+        Args:
+            path: Path of the app.
+            name: Dotted name of the app.
+            eligible: Whether the app should be eligible.
+        """
+        mock_app_config = Mock(spec=AppConfig)
+        mock_app_config.path = path
+        mock_app_config.name = name
+
+        assert (
+            is_app_eligible(
+                mock_app_config, "site-packages", frozenset({"extra_app"})
+            )
+            is eligible
+        )
+
 
 @pytest.mark.django_db
 class TestTableCreation:
@@ -122,6 +233,128 @@ class TestTableCreation:
         if "." not in model._meta.db_table and "[" not in model._meta.db_table:
             assert schema == expected_schema
 
+    @pytest.mark.parametrize(
+        ("table_name", "expected"),
+        [
+            (
+                "[ALT_SCHEMA].[unmanaged_model]",
+                ("ALT_SCHEMA", "unmanaged_model"),
+            ),
+            ('"schema"."table"', ("schema", "table")),
+            ("'schema'.'table'", ("schema", "table")),
+            ("schema.table", ("schema", "table")),
+        ],
+    )
+    def test_qualified_table_name_parsing(
+        self,
+        connection: BaseDatabaseWrapper,
+        table_name: str,
+        expected: tuple[str, str],
+    ) -> None:
+        """
+        Test parsing of schema-qualified and quoted table names.
+
+        Args:
+            connection: Database connection fixture.
+            table_name: Table name to parse.
+            expected: Expected (schema, table) tuple.
+        """
+        assert parse_table_name(connection, table_name) == expected
+
+    def test_existing_tables_prefetched(
+        self, connection: BaseDatabaseWrapper
+    ) -> None:
+        """
+        Test that existing tables are fetched in a single lookup.
+
+        Args:
+            connection: Database connection fixture.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE TABLE prefetched_table (id integer)")
+
+        existing_tables = get_existing_tables(connection, {"main"})
+
+        assert ("main", "prefetched_table") in existing_tables
+        assert ("main", "mixed_unmanaged_model") not in existing_tables
+
+    def test_existing_columns_prefetched(
+        self, connection: BaseDatabaseWrapper
+    ) -> None:
+        """
+        Test that existing columns are fetched per table in a single lookup.
+
+        Args:
+            connection: Database connection fixture.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "CREATE TABLE prefetched_table (id integer, name varchar(10))"
+            )
+
+        existing_columns = get_existing_columns(
+            connection, {("main", "prefetched_table"), ("main", "missing")}
+        )
+
+        assert existing_columns == {
+            ("main", "prefetched_table"): {
+                "id": "INTEGER",
+                "name": "varchar(10)",
+            }
+        }
+
+    def test_existing_columns_bound_by_schema(
+        self, mocker: MockerFixture
+    ) -> None:
+        """
+        Test that columns of many tables are looked up by schema.
+
+        Args:
+            mocker: Pytest mocker fixture.
+        """
+        connection = mocker.MagicMock(vendor="microsoft")
+        cursor_mock = connection.cursor.return_value.__enter__.return_value
+        cursor_mock.fetchall.return_value = [
+            ("dbo", "table_0", "id", "int"),
+            ("dbo", "other_table", "id", "int"),
+        ]
+        tables = {("dbo", f"table_{index}") for index in range(1500)}
+
+        existing_columns = get_existing_columns(connection, tables)
+
+        assert cursor_mock.execute.call_args.args[1] == ["dbo"]
+        assert existing_columns == {("dbo", "table_0"): {"id": "int"}}
+
+    def test_table_names_restored_when_formatting_fails(
+        self, mocker: MockerFixture
+    ) -> None:
+        """
+        Test that formatted table names are undone if formatting fails.
+
+        Args:
+            mocker: Pytest mocker fixture.
+        """
+        module = (
+            "django_unmanaged_assistant.management.commands."
+            "create_unmanaged_tables"
+        )
+        mocker.patch(f"{module}.get_existing_tables", return_value=set())
+        mocker.patch(f"{module}.get_existing_columns", return_value={})
+        mocker.patch(f"{module}.create_schemas_if_not_exist")
+        mocker.patch(
+            f"{module}.get_formatted_table_name",
+            side_effect=["formatted_table", ValueError("bad table name")],
+        )
+        connection = mocker.MagicMock(vendor="postgresql", alias="other")
+        models = [MixedUnmanagedModel, MixedUnmanagedModelNC]
+        db_tables = [model._meta.db_table for model in models]
+
+        command = Command(stdout=StringIO(), stderr=StringIO())
+        with pytest.raises(ValueError, match="bad table name"):
+            command.process_connection(connection, models)
+
+        assert [model._meta.db_table for model in models] == db_tables
+
 
 class TestFieldProcessing:
     """Tests for processing different field configurations."""
@@ -155,8 +388,147 @@ class TestFieldProcessing:
             expected_column: Expected column name.
         """
         field = model._meta.get_field(field_name)
-        column_name = field.db_column or field.name
-        assert column_name == expected_column
+        assert get_column_name(field) == expected_column
+
+    @pytest.mark.parametrize(
+        ("model", "field_name"),
+        [
+            (MixedUnmanagedModel, "name"),
+            (MixedUnmanagedModel, "address"),
+            (MixedUnmanagedModelWithFk, "related_model"),
+        ],
+    )
+    def test_field_db_type(
+        self,
+        connection: BaseDatabaseWrapper,
+        model: type,
+        field_name: str,
+    ) -> None:
+        """
+        Test that cached field database types match the field's own type.
+
+        Args:
+            connection: Database connection fixture.
+            model: Model class to test.
+            field_name: Name of the field to test.
+        """
+        field = model._meta.get_field(field_name)
+        expected_type = field.db_type(connection)
+        cache = {}
+        assert get_field_db_type(connection, field, cache) == expected_type
+        assert get_field_db_type(connection, field, cache) == expected_type
+
+
+class TestTypeCompatibility:
+    """Tests for comparing existing column types with field types."""
+
+    @pytest.mark.parametrize(
+        ("existing_type", "expected_type", "compatible"),
+        [
+            ("INTEGER", "integer", True),
+            ("bigint", "int", True),
+            ("nvarchar", "text", True),
+            ("bit", "bool", True),
+            ("varchar(100)", "varchar(100)", True),
+            ("character varying", "varchar(255)", True),
+            ("int4", "integer", True),
+            ("timestamp with time zone", "datetime2", True),
+            ("decimal(10, 2)", "numeric(12, 4)", True),
+            ("integer", "varchar", False),
+            ("unknown", "unknown", False),
+            (None, "integer", False),
+        ],
+    )
+    def test_types_are_compatible(
+        self,
+        existing_type: str | None,
+        expected_type: str,
+        compatible: bool,
+    ) -> None:
+        """
+        Test compatibility of existing and expected column types.
+
+        Args:
+            existing_type: Existing database column type.
+            expected_type: Expected database column type.
+            compatible: Whether the types should be compatible.
+        """
+        assert types_are_compatible(existing_type, expected_type) is compatible
+
+
+class PostgresSchemaEditor(BaseDatabaseSchemaEditor):
+    """Schema editor generating PostgreSQL style ALTER TABLE statements."""
+
+    quote_value = SQLiteSchemaEditor.quote_value
+    prepare_default = SQLiteSchemaEditor.prepare_default
+
+
+class TestColumnAddition:
+    """Tests for adding missing columns to existing tables."""
+
+    def test_alter_table_statements_combined(self) -> None:
+        """Test that a table's ALTER TABLE statements are combined."""
+        statements = [
+            ('ALTER TABLE "t" ADD COLUMN "a" integer DEFAULT %s', [1]),
+            ('ALTER TABLE "t" ALTER COLUMN "a" DROP DEFAULT', []),
+            (
+                'ALTER TABLE "t" ADD COLUMN "b" varchar(5) CHECK (b <> \'%\')',
+                None,
+            ),
+            ('CREATE INDEX "t_b" ON "t" ("b")', None),
+        ]
+
+        assert combine_alter_table_statements('"t"', statements) == [
+            (
+                'ALTER TABLE "t" ADD COLUMN "a" integer DEFAULT %s, '
+                "ADD COLUMN \"b\" varchar(5) CHECK (b <> '%%')",
+                [1],
+            ),
+            ('ALTER TABLE "t" ALTER COLUMN "a" DROP DEFAULT', None),
+            ('CREATE INDEX "t_b" ON "t" ("b")', None),
+        ]
+
+    @pytest.mark.django_db
+    def test_postgresql_columns_added_together(
+        self, connection: BaseDatabaseWrapper, mocker: MockerFixture
+    ) -> None:
+        """
+        Test that PostgreSQL columns are added with a single ALTER TABLE.
+
+        Args:
+            connection: Database connection fixture.
+            mocker: Pytest mocker fixture.
+        """
+        mocker.patch.object(connection, "vendor", "postgresql")
+        cursor = mocker.patch.object(
+            connection, "cursor"
+        ).return_value.__enter__.return_value
+        fields = [
+            (MixedUnmanagedModelNC._meta.get_field(name), name)
+            for name in ("name", "realistic")
+        ]
+
+        stderr = StringIO()
+        command = Command(stdout=StringIO(), stderr=stderr)
+        with PostgresSchemaEditor(connection, atomic=False) as schema_editor:
+            command.add_fields(schema_editor, MixedUnmanagedModelNC, fields)
+
+        assert stderr.getvalue() == ""
+        assert [call.args for call in cursor.execute.call_args_list] == [
+            (
+                'ALTER TABLE "mixed_unmanaged_model_nc" '
+                'ADD COLUMN "name" varchar(100) NOT NULL, '
+                'ADD COLUMN "realistic" bool DEFAULT 1 NOT NULL',
+                None,
+            ),
+            (
+                'ALTER TABLE "mixed_unmanaged_model_nc" '
+                'ALTER COLUMN "realistic" DROP DEFAULT',
+                None,
+            ),
+        ]
+        assert schema_editor.collect_sql is False
+        assert not hasattr(schema_editor, "collected_sql")
 
 
 @pytest.mark.django_db
@@ -193,13 +565,50 @@ class TestForeignKeyHandling:
             )
 
             # Test with FK model
+            schema, table = parse_table_name(
+                connection, MixedUnmanagedModelWithFk._meta.db_table
+            )
             command.create_table_for_model(
-                connection, schema_editor, MixedUnmanagedModelWithFk
+                connection,
+                schema_editor,
+                MixedUnmanagedModelWithFk,
+                schema,
+                table,
             )
 
             # Verify create_model was called
             assert schema_editor.create_model.called
 
+    def test_managed_foreign_key_column_name(
+        self, connection: BaseDatabaseWrapper, mocker: MockerFixture
+    ) -> None:
+        """
+        Test that FKs of managed models resolve to their "_id" column.
+
+        Args:
+            connection: Database connection fixture.
+            mocker: Pytest mocker fixture.
+        """
+        command = Command(stdout=StringIO(), stderr=StringIO())
+        command.verbose = False
+        schema, table = parse_table_name(
+            connection, MixedManagedModelWithFk._meta.db_table
+        )
+        command._existing_tables[connection.alias] = {(schema, table)}
+        mocker.patch.object(command, "create_model_table", return_value=True)
+        process_field = mocker.patch.object(
+            command, "process_field", return_value=False
+        )
+        mocker.patch.object(command, "add_fields")
+
+        command.create_table_for_model(
+            connection, Mock(), MixedManagedModelWithFk, schema, table
+        )
+
+        column_names = [call.args[-1] for call in process_field.call_args_list]
+        assert "related_managed_model_id" in column_names
+        assert "related_managed_model" not in column_names
+
 
 @pytest.mark.django_db
 class TestSchemaHandling:
@@ -242,15 +651,108 @@ class TestSchemaHandling:
             create_schema_if_not_exists(connection, parsed_schema)
             assert cursor_mock.execute.called
 
+    def test_schemas_created_in_one_statement(
+        self, mocker: MockerFixture
+    ) -> None:
+        """
+        Test that all schemas are created with a single statement.
+
+        Args:
+            mocker: Pytest mocker fixture.
+        """
+        connection = mocker.MagicMock(vendor="postgresql")
+        connection.ops.quote_name = lambda name: f'"{name}"'
+        cursor_mock = connection.cursor.return_value.__enter__.return_value
+
+        create_schemas_if_not_exist(connection, ["ALT_SCHEMA", "other"])
+
+        cursor_mock.execute.assert_called_once_with(
+            'CREATE SCHEMA IF NOT EXISTS "ALT_SCHEMA"; '
+            'CREATE SCHEMA IF NOT EXISTS "other"',
+            None,
+        )
+
+
+class SplitRouter:
+    """Router sending MixedUnmanagedModel to 'second', others to 'first'."""
+
+    def db_for_write(self, model: type, **hints: object) -> str:
+        """
+        Return the database alias to write the model to.
+
+        Args:
+            model: Model class being routed.
+            **hints: Routing hints.
+
+        Returns:
+            str: The database alias.
+        """
+        return "second" if model is MixedUnmanagedModel else "first"
+
 
 @pytest.mark.django_db
 class TestIntegration:
     """Integration tests for the management command."""
 
+    def test_models_processed_on_each_database(
+        self,
+        mocker: MockerFixture,
+        tmp_path: Path,
+        django_db_blocker: DjangoDbBlocker,
+    ) -> None:
+        """
+        Test that models routed to two databases are created on both.
+
+        Args:
+            mocker: Pytest mocker fixture.
+            tmp_path: Temporary directory for the database files.
+            django_db_blocker: Fixture controlling database access.
+        """
+        module = (
+            "django_unmanaged_assistant.management.commands."
+            "create_unmanaged_tables"
+        )
+        test_connections = ConnectionHandler(
+            {
+                alias: {
+                    "ENGINE": "django.db.backends.sqlite3",
+                    "NAME": str(tmp_path / f"{alias}.sqlite3"),
+                }
+                for alias in ("default", "first", "second")
+            }
+        )
+        mocker.patch(f"{module}.connections", test_connections)
+        mocker.patch("django.db.transaction.connections", test_connections)
+        mocker.patch(f"{module}.router", ConnectionRouter([SplitRouter()]))
+        command = Command(stdout=StringIO(), stderr=StringIO())
+        command.verbose = False
+        command.models_to_process = [
+            MixedUnmanagedModelNC,
+            MixedUnmanagedModel,
+        ]
+
+        with django_db_blocker.unblock():
+            command.process_models()
+
+            tables = {}
+            for alias in ("first", "second"):
+                connection = test_connections[alias]
+                with connection.cursor() as cursor:
+                    tables[alias] = connection.introspection.table_names(
+                        cursor
+                    )
+                connection.close()
+
+        assert tables == {
+            "first": ["mixed_unmanaged_model_nc"],
+            "second": ["mixed_unmanaged_model"],
+        }
+
     def test_full_command_execution(
         self,
         connection: BaseDatabaseWrapper,
-        unmanaged_models: list[type],
+        unmanaged_models: tuple[type, ...],
+        mock_unmanaged_app_config: Mock,
         mocker: MockerFixture,
         stdout: StringIO,
         stderr: StringIO,
@@ -260,20 +762,16 @@ class TestIntegration:
 
         Args:
             connection: Database connection fixture.
-            unmanaged_models: List of unmanaged model classes.
+            unmanaged_models: Tuple of unmanaged model classes.
+            mock_unmanaged_app_config: Mock app config of the test app.
             mocker: Pytest mocker fixture.
             stdout: StringIO fixture for stdout.
             stderr: StringIO fixture for stderr.
         """
-        # Mock the app config
-        mock_app_config = mocker.Mock(spec=AppConfig)
-        mock_app_config.path = "/path/to/app"
-        mock_app_config.name = "test_app"
-        mock_app_config.get_models.return_value = unmanaged_models
-
         # Mock the apps registry
         mocker.patch(
-            "django.apps.apps.get_app_configs", return_value=[mock_app_config]
+            "django.apps.apps.get_app_configs",
+            return_value=[mock_unmanaged_app_config],
         )
 
         # Create and execute command directly